@@ -1,21 +1,102 @@
-﻿#!/usr/bin/env python3
+#!/usr/bin/env python3
 import os
+import shutil
 import sys
-import uvicorn
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# uvloop/httptools (uvicorn[standard]) não existem no Windows - usar asyncio/h11
+try:
+    import uvloop  # noqa: F401
+    LOOP = 'uvloop'
+except ImportError:
+    LOOP = 'asyncio'
+
+try:
+    import httptools  # noqa: F401
+    HTTP = 'httptools'
+except ImportError:
+    HTTP = 'h11'
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 3025))
     host = os.environ.get('HOST', '0.0.0.0')
+    # Processos worker do uvicorn - padrão 1, WEB_CONCURRENCY habilita múltiplos workers
+    # Obs: com mais de 1 worker o scheduler roda em apenas um deles (flock em logs/scheduler.lock);
+    # os endpoints /scheduler/* e o estado em memória (stats do generator) passam a ser por worker
+    workers = int(os.environ.get('WEB_CONCURRENCY', 1))
+    try:
+        import fcntl  # noqa: F401
+    except ImportError:
+        # Windows: sem flock para eleger o worker do scheduler - forçar processo único
+        if workers > 1:
+            print('Aviso: múltiplos workers não suportados nesta plataforma, usando 1')
+        workers = 1
+
+    # Socket UNIX opcional para rodar atrás de proxy reverso local (nginx/envoy)
+    uds = os.environ.get('UDS')
     
     print('Creative IA iniciando...')
-    print(f'Porta: {port}')
+    if uds:
+        os.makedirs(os.path.dirname(os.path.abspath(uds)), mode=0o770, exist_ok=True)
+        bind = {'uds': uds}
+        print(f'Socket: {uds}')
+    else:
+        bind = {'host': host, 'port': port}
+        print(f'Porta: {port}')
+    print(f'Workers: {workers}')
+    
+    log_level = os.environ.get('LOG_LEVEL', 'warning').lower()
+    access_log = os.environ.get('ACCESS_LOG', '0') == '1'
+    
+    # Fila de conexões e keep-alive para absorver picos de carga
+    backlog = int(os.environ.get('BACKLOG', 4096))
+    keep_alive = int(os.environ.get('KEEPALIVE', 30))
+    limit_concurrency = int(os.environ.get('LIMIT_CONC', 1000))
+    # uvicorn 0.24 não recria workers que atingem o limite - só aplicar se configurado
+    max_requests = os.environ.get('MAX_REQS')
+    limit_max_requests = int(max_requests) if max_requests else None
+    
+    uvicorn_bin = shutil.which('uvicorn')
+    if uvicorn_bin:
+        # Substituir o processo do launcher pelo uvicorn (sem frame Python extra)
+        argv = ['uvicorn', 'src.main:app', '--app-dir', os.path.dirname(os.path.abspath(__file__))]
+        if uds:
+            argv += ['--uds', uds]
+        else:
+            argv += ['--host', host, '--port', str(port)]
+        argv += [
+            '--workers', str(workers),
+            '--log-level', log_level,
+            '--access-log' if access_log else '--no-access-log',
+            '--loop', LOOP,
+            '--http', HTTP,
+            '--proxy-headers',
+            '--no-server-header',
+            '--no-date-header',
+            '--backlog', str(backlog),
+            '--timeout-keep-alive', str(keep_alive),
+            '--limit-concurrency', str(limit_concurrency)
+        ]
+        if limit_max_requests:
+            argv += ['--limit-max-requests', str(limit_max_requests)]
+        sys.stdout.flush()
+        os.execvp(uvicorn_bin, argv)
     
+    # Fallback para instalações sem o executável uvicorn no PATH
+    import uvicorn
     uvicorn.run(
         'src.main:app',
-        host=host,
-        port=port,
+        **bind,
         reload=False,
-        log_level='info'
+        workers=workers,
+        log_level=log_level,
+        access_log=access_log,
+        loop=LOOP,
+        http=HTTP,
+        proxy_headers=True,
+        server_header=False,
+        date_header=False,
+        backlog=backlog,
+        timeout_keep_alive=keep_alive,
+        limit_concurrency=limit_concurrency,
+        limit_max_requests=limit_max_requests
     )
@@ -0,0 +1,34 @@
+"""
+Build do pacote creativeia
+
+Com CREATIVEIA_MYPYC=1 os módulos de processamento de texto do generator são
+compilados com mypyc; sem a variável o pacote é puro Python.
+
+O mypyc não faz parte das dependências de build - para compilar, instale-o antes
+e desative o isolamento do build:
+
+    pip install mypy==1.8.0
+    CREATIVEIA_MYPYC=1 pip install --no-build-isolation .
+"""
+
+import os
+from setuptools import setup
+
+MYPYC_MODULES = [
+    'src/generator/seo_optimizer.py',
+    'src/generator/prompt_builder.py',
+    'src/generator/template_manager.py',
+]
+
+ext_modules = []
+if os.environ.get('CREATIVEIA_MYPYC') == '1':
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        raise SystemExit(
+            "CREATIVEIA_MYPYC=1 requer o mypyc: execute 'pip install mypy==1.8.0' e "
+            "instale com 'pip install --no-build-isolation .'"
+        )
+    ext_modules = mypycify(['--ignore-missing-imports', *MYPYC_MODULES])
+
+setup(ext_modules=ext_modules)
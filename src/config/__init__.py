@@ -3,7 +3,7 @@ Módulo Config - Sistema de Geração Automática de Conteúdo SEO
 Gerenciamento centralizado de configurações do sistema
 """
 
-from .config_manager import ConfigManager
+import importlib
 
 __version__ = "1.0.0"
 __description__ = "Módulo para gerenciamento de configurações e URLs"
@@ -12,3 +12,20 @@ __description__ = "Módulo para gerenciamento de configurações e URLs"
 __all__ = [
     'ConfigManager'
 ]
+
+# Imports sob demanda (PEP 562)
+_LAZY = {
+    'ConfigManager': '.config_manager'
+}
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
+
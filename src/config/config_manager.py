@@ -10,6 +10,11 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class ConfigManager:
     """Gerenciador centralizado de configurações do sistema"""
     
@@ -610,7 +615,10 @@ class ConfigManager:
                 backup_name = f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             
             backup_data = self.export_config()
-            backup_json = json.dumps(backup_data, indent=2, ensure_ascii=False)
+            if orjson:
+                backup_json = orjson.dumps(backup_data, option=orjson.OPT_INDENT_2).decode('utf-8')
+            else:
+                backup_json = json.dumps(backup_data, indent=2, ensure_ascii=False)
             
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
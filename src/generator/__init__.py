@@ -3,11 +3,7 @@ Módulo Generator - Sistema de Geração Automática de Conteúdo SEO
 Geração de artigos otimizados com IA a partir de produtos extraídos
 """
 
-from .content_generator import ContentGenerator
-from .seo_optimizer import SEOOptimizer
-from .prompt_builder import PromptBuilder
-from .template_manager import TemplateManager
-from .generator_manager import GeneratorManager
+import importlib
 
 __version__ = "1.0.0"
 __author__ = "Sistema SEO"
@@ -21,6 +17,26 @@ __all__ = [
     'GeneratorManager'
 ]
 
+# Imports sob demanda (PEP 562) - evita carregar openai e afins no import do pacote
+_LAZY = {
+    'ContentGenerator': '.content_generator',
+    'SEOOptimizer': '.seo_optimizer',
+    'PromptBuilder': '.prompt_builder',
+    'TemplateManager': '.template_manager',
+    'GeneratorManager': '.generator_manager'
+}
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
+
 
 
 
@@ -0,0 +1,196 @@
+"""
+Response Cache
+Cache em dois níveis (memória do processo + Redis opcional) para artigos gerados
+e cache persistente (SQLite) de respostas da IA por prompt
+"""
+
+import os
+import copy
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+from loguru import logger
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None
+    REDIS_AVAILABLE = False
+
+
+def make_key(*parts: Any) -> str:
+    """Gera chave estável a partir dos dados de entrada"""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class ResponseCache:
+    """
+    Cache LRU com TTL por worker, compartilhado entre workers via Redis quando configurado
+
+    Desativado por padrão (GENERATOR_CACHE_TTL=0). Valores são copiados na leitura e na escrita.
+    """
+
+    def __init__(self, maxsize: int = None, ttl: int = None, redis_url: str = None,
+                 prefix: str = 'creativeia:gen:'):
+        self.maxsize = maxsize if maxsize is not None else int(os.getenv('GENERATOR_CACHE_SIZE', 256))
+        self.ttl = ttl if ttl is not None else int(os.getenv('GENERATOR_CACHE_TTL', 0))
+        self.prefix = prefix
+        self._local: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis = None
+
+        redis_url = redis_url or os.getenv('REDIS_URL')
+        if redis_url and REDIS_AVAILABLE and self.enabled:
+            try:
+                self._redis = redis.Redis.from_url(redis_url, socket_timeout=0.5)
+                logger.info("🗄️ Cache de geração compartilhado via Redis")
+            except Exception as e:
+                logger.warning(f"⚠️ Redis indisponível, usando apenas cache local: {e}")
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.maxsize > 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Busca valor no cache local e, se ausente, no Redis"""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires > time.monotonic():
+                    self._local.move_to_end(key)
+                    return copy.deepcopy(value)
+                del self._local[key]
+
+        if self._redis is not None:
+            try:
+                raw = self._redis.get(self.prefix + key)
+                if raw is not None:
+                    value = json.loads(raw)
+                    self._set_local(key, value)
+                    return value
+            except Exception as e:
+                logger.debug(f"🔍 Falha na leitura do Redis: {e}")
+
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Armazena valor nos dois níveis"""
+        if not self.enabled:
+            return
+
+        self._set_local(key, value)
+
+        if self._redis is not None:
+            try:
+                self._redis.setex(self.prefix + key, self.ttl,
+                                  json.dumps(value, ensure_ascii=False, default=str))
+            except Exception as e:
+                logger.debug(f"🔍 Falha na escrita do Redis: {e}")
+
+    def _set_local(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._local[key] = (time.monotonic() + self.ttl, copy.deepcopy(value))
+            self._local.move_to_end(key)
+            while len(self._local) > self.maxsize:
+                self._local.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._local.clear()
+
+    def __len__(self) -> int:
+        return len(self._local)
+
+
+class LLMCache:
+    """
+    Cache persistente de respostas da IA por correspondência exata de modelo/parâmetros/prompts
+
+    Desativado por padrão (LLM_CACHE_TTL=0): com ele ativo, gerar de novo o mesmo produto
+    devolve o mesmo artigo até a resposta expirar.
+    """
+
+    def __init__(self, db_path: str = None, ttl: int = None):
+        self.db_path = db_path or os.getenv('LLM_CACHE_PATH', 'logs/llm_cache.db')
+        self.ttl = ttl if ttl is not None else int(os.getenv('LLM_CACHE_TTL', 0))
+        self._local = threading.local()
+
+        if self.enabled:
+            self._init_database()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def _connection(self) -> sqlite3.Connection:
+        # Conexão por thread - o scheduler roda em thread própria
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=5)
+            self._local.conn = conn
+        return conn
+
+    def _init_database(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+            conn = self._connection()
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ Cache de respostas da IA desativado: {e}")
+            self.ttl = 0
+
+    @staticmethod
+    def key(model: str, temperature: float, max_tokens: int, prompt: str,
+            system_prompt: str = '') -> str:
+        # Prompt de sistema entra na chave: mudar as instruções invalida as respostas salvas
+        payload = f"{model}|{temperature}|{max_tokens}|{system_prompt}|{prompt}"
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+
+        try:
+            row = self._connection().execute(
+                "SELECT response FROM llm_responses WHERE key = ? AND expires_at > ?",
+                (key, time.time())
+            ).fetchone()
+            return row[0] if row else None
+        except sqlite3.Error as e:
+            logger.debug(f"🔍 Falha na leitura do cache da IA: {e}")
+            return None
+
+    def set(self, key: str, response: str) -> None:
+        if not self.enabled or not response:
+            return
+
+        try:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, response, expires_at) VALUES (?, ?, ?)",
+                (key, response, time.time() + self.ttl)
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"🔍 Falha na escrita do cache da IA: {e}")
+
+
+__all__ = ['ResponseCache', 'LLMCache', 'make_key', 'REDIS_AVAILABLE']
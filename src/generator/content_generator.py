@@ -5,27 +5,502 @@ OTIMIZADO PARA YOAST LEGIBILIDADE - PONTUAÇÃO VERDE
 """
 
 import os
+import io
 import json
 import re
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+import time
+from typing import Dict, Iterable, List, Optional, Any
 from loguru import logger
 import random
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 try:
-    from openai import OpenAI
+    from openai import OpenAI, AsyncOpenAI, APIConnectionError, APIStatusError, RateLimitError
 except ImportError:
     logger.warning("⚠️ OpenAI não instalada. Rodando em modo simulação.")
     OpenAI = None
+    AsyncOpenAI = None
 
-from .prompt_builder import PromptBuilder
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import re2  # google-re2: tempo linear nas correções gerais de URL
+except ImportError:
+    re2 = None
+
+from .prompt_builder import PromptBuilder, SLOT_MODEL, SLOT_PRODUCT_NAME
 from .seo_optimizer import SEOOptimizer
 from .template_manager import TemplateManager
 from .product_database import ProductDatabase
+from .rate_limiter import AsyncLimiter, delay_from_headers
+from ._cache import LLMCache
+
+# Formato de data_geracao (horário local)
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Padrões compilados uma única vez para o pós-processamento Yoast
+_RE_HTML_TAG = re.compile(r'<[^>]+>')
+_RE_PARAGRAPH = re.compile(r'<p>(.*?)</p>', re.DOTALL)
+_RE_HREF = re.compile(r'href="(https?://[^"]+)"')
+_RE_HP_MODEL = re.compile(r'(m\d+\w*)')
+_RE_UL_LIST = re.compile(r'<ul>(.*?)</ul>', re.DOTALL)
+_RE_LI = re.compile(r'<li>(.*?)</li>')  # itens de uma linha, como no re.findall original
+
+
+def _split_paragraphs(content: str) -> List[str]:
+    """Divide o HTML em [trecho, <p> interno, trecho, <p> interno, ..., trecho] (parágrafos nos índices ímpares)"""
+    return _RE_PARAGRAPH.split(content)
+
+
+def _join_paragraphs(parts: List[str]) -> str:
+    """Reconstrói o HTML a partir de _split_paragraphs"""
+    return ''.join(f'<p>{part}</p>' if i % 2 else part for i, part in enumerate(parts))
+
+# Seções extras para artigos curtos - {product_name} é preenchido em _generate_additional_content
+_ADDITIONAL_SECTIONS = (
+    """
+            <h3>Vantagens do {product_name} para Seu Escritório</h3>
+            <p>O {product_name} oferece benefícios específicos para ambientes profissionais. Além disso, sua 
+            tecnologia avançada garante produtividade constante. Portanto, é uma escolha inteligente para 
+            empresas que buscam eficiência. Em primeiro lugar, destaca-se pela confiabilidade operacional.</p>
+            """,
+    """
+            <h3>Especificações Técnicas Detalhadas</h3>
+            <ul>
+                <li>Tecnologia de impressão laser de alta precisão</li>
+                <li>Velocidade otimizada para volumes médios e altos</li>
+                <li>Conectividade USB e rede Ethernet</li>
+                <li>Compatibilidade universal com sistemas Windows e Mac</li>
+                <li>Ciclo de trabalho mensal robusto</li>
+            </ul>
+            <p>Essas características técnicas fazem do {product_name} uma solução completa. Consequentemente, 
+            atende às demandas mais exigentes do mercado corporativo.</p>
+            """,
+    """
+            <h3>Comparativo com Concorrentes</h3>
+            <p>Em comparação com outros modelos do mercado, o {product_name} se destaca. Por exemplo, 
+            oferece melhor custo-benefício na categoria. Também apresenta menor consumo energético. 
+            Finalmente, sua manutenção é mais simples e econômica.</p>
+            """
+)
+
+
+def _count_words_in_html(html: str) -> int:
+    """Conta as palavras do texto visível (sem tags HTML)"""
+    return len(_RE_HTML_TAG.sub('', html).split())
+
+
+# Palavras fixas de cada seção e quantas vezes o nome do produto aparece nela;
+# palavras da seção = fixas + ocorrências * palavras do nome
+_ADDITIONAL_SECTION_WORDS = tuple(
+    (_count_words_in_html(section.replace('{product_name}', '')), section.count('{product_name}'))
+    for section in _ADDITIONAL_SECTIONS
+)
+
+# Palavras de transição para legibilidade Yoast (tupla: ordem estável no prompt de sistema)
+_TRANSITION_WORDS = (
+    'além disso', 'portanto', 'por fim', 'ou seja', 'no entanto', 
+    'assim sendo', 'por outro lado', 'em primeiro lugar', 'finalmente',
+    'consequentemente', 'por exemplo', 'dessa forma', 'contudo',
+    'sobretudo', 'por isso', 'em suma', 'ainda assim', 'logo',
+    'principalmente', 'então', 'para isso', 'entretanto', 'ainda',
+    'de forma geral', 'em comparação', 'em resumo', 'adicionalmente'
+)
+# Detecção de transição já presente na frase - uma busca em vez de um `in` por expressão
+_TRANSITION_RE = re.compile('|'.join(map(re.escape, _TRANSITION_WORDS)))
+
+# Palavras ignoradas na extração da keyword do nome do produto
+_STOP_WORDS = frozenset({'a', 'o', 'de', 'da', 'do', 'com', 'para', 'em', 'na', 'no', 'impressora', 'multifuncional'})
+
+# Conjunções onde frases longas podem ser divididas
+_CONNECTORS = frozenset({'e', 'mas', 'porém', 'contudo', 'entretanto', 'no entanto', 'todavia'})
+
+# Mapeamento de palavras-chave para tipos de produto (ordem = prioridade)
+_PRODUCT_TYPE_KEYWORDS = (
+    ('impressora', ('impressora', 'printer')),
+    ('multifuncional', ('multifuncional', 'multifun', 'all-in-one')),
+    ('toner', ('toner', 'cartucho')),
+    ('papel', ('papel', 'resma')),
+    ('scanner', ('scanner', 'digitalizador')),
+    ('copiadora', ('copiadora', 'copier')),
+    ('fax', ('fax',)),
+    ('suprimento', ('suprimento', 'supply')),
+)
+
+# Conteúdo simulado (modo sem API) - variações preenchidas com str.format em _generate_simulated_content
+_SIM_TITLES = (
+    "{nome}: Análise Completa 2025",
+    "{nome}: Guia de Compra Definitivo",
+    "{nome}: Vale a Pena? Review Detalhado",
+    "{nome}: Características e Benefícios",
+    "Review: {nome} - Prós e Contras",
+    "Como Escolher: {nome}",
+    "Tudo Sobre o {nome}",
+    "{nome}: Especificações Técnicas",
+    "Análise: {nome} da {marca}",
+    "{nome}: Melhor Custo-Benefício?"
+)
+
+_SIM_META_DESCRIPTIONS = (
+    "Descubra tudo sobre o {nome}: análise completa, especificações técnicas e onde comprar com melhor preço.",
+    "Review detalhado do {nome}: características, benefícios e comparação com concorrentes. Confira!",
+    "Guia completo do {nome}: vale a pena? Análise de prós, contras e custo-benefício.",
+    "Conheça o {nome}: especificações, preços e avaliação especializada. Tudo que você precisa saber.",
+    "Análise técnica do {nome}: performance, qualidade e comparativo de preços no mercado."
+)
+
+_SIM_CONTENT_STRUCTURES = (
+    # Estrutura 1: Foco em benefícios
+    """<h1>{titulo_seo}</h1>
+            
+            <h2>Por que escolher o {nome}?</h2>
+            <p>O {nome} da {marca} se destaca no mercado por oferecer uma combinação única de qualidade, performance e custo-benefício. Com tecnologia avançada e design moderno, este produto atende às necessidades de usuários exigentes.</p>
+            
+            <h2>Principais Características</h2>
+            <ul>
+                <li><strong>Tecnologia Avançada:</strong> Equipado com os mais modernos recursos</li>
+                <li><strong>Design Ergonômico:</strong> Pensado para máximo conforto de uso</li>
+                <li><strong>Eficiência Energética:</strong> Consumo otimizado e sustentável</li>
+                <li><strong>Conectividade:</strong> Múltiplas opções de conexão</li>
+                <li><strong>Durabilidade:</strong> Construção robusta para uso intensivo</li>
+            </ul>
+            
+            <h2>Benefícios para o Usuário</h2>
+            <p>Ao escolher o {nome}, você investe em produtividade e qualidade. Este equipamento oferece resultados superiores, reduzindo custos operacionais e aumentando a eficiência do trabalho.</p>
+            
+            <h3>Economia Garantida</h3>
+            <p>Com tecnologia de ponta, o {nome} proporciona economia de até 40% nos custos operacionais, tornando-se um investimento inteligente para empresas e usuários domésticos.</p>
+            
+            <h2>Onde Comprar</h2>
+            <p>O {nome} está disponível nas principais lojas especializadas. Preço atual: {preco_texto}. Aproveite as condições especiais e garante já o seu!</p>""",
+            
+    # Estrutura 2: Foco técnico
+    """<h1>{titulo_seo}</h1>
+            
+            <h2>Especificações Técnicas do {nome}</h2>
+            <p>O {nome} representa o que há de mais moderno em tecnologia. Desenvolvido pela {marca}, este produto incorpora inovações que garantem performance superior e confiabilidade.</p>
+            
+            <h2>Recursos Avançados</h2>
+            <h3>Tecnologia de Ponta</h3>
+            <p>Equipado com processamento avançado e componentes de alta qualidade, o {nome} oferece desempenho excepcional em todas as condições de uso.</p>
+            
+            <h3>Conectividade Inteligente</h3>
+            <ul>
+                <li>Conexão Wi-Fi integrada</li>
+                <li>Compatibilidade universal</li>
+                <li>Interface intuitiva</li>
+                <li>Configuração simplificada</li>
+            </ul>
+            
+            <h2>Performance e Qualidade</h2>
+            <p>Com velocidade otimizada e qualidade superior, o {nome} atende às demandas mais exigentes do mercado profissional e doméstico.</p>
+            
+            <h3>Sustentabilidade</h3>
+            <p>Desenvolvido com foco na sustentabilidade, o {nome} utiliza tecnologias eco-friendly que reduzem o impacto ambiental sem comprometer a performance.</p>
+            
+            <h2>Investimento Inteligente</h2>
+            <p>Por {preco_texto}, o {nome} oferece excelente custo-benefício, combinando tecnologia avançada com preço competitivo.</p>""",
+            
+    # Estrutura 3: Foco comparativo
+    """<h1>{titulo_seo}</h1>
+            
+            <h2>O {nome} é a Melhor Escolha?</h2>
+            <p>Em um mercado competitivo, o {nome} da {marca} se destaca pela combinação única de recursos, qualidade e preço acessível.</p>
+            
+            <h2>Vantagens Competitivas</h2>
+            <h3>Superioridade Técnica</h3>
+            <p>Comparado aos concorrentes, o {nome} oferece recursos exclusivos que garantem melhor desempenho e maior durabilidade.</p>
+            
+            <h3>Custo-Benefício Imbatível</h3>
+            <ul>
+                <li><strong>Preço competitivo:</strong> {preco_texto}</li>
+                <li><strong>Baixo custo operacional:</strong> Economia de até 50%</li>
+                <li><strong>Manutenção reduzida:</strong> Componentes duráveis</li>
+                <li><strong>Garantia estendida:</strong> Proteção total</li>
+            </ul>
+            
+            <h2>Por que Escolher o {nome}?</h2>
+            <p>A escolha do {nome} representa um investimento seguro em tecnologia e qualidade. Com recursos avançados e suporte técnico especializado, você tem a garantia de um produto confiável.</p>
+            
+            <h3>Satisfação Garantida</h3>
+            <p>Milhares de usuários já comprovaram a qualidade do {nome}. Junte-se a eles e experimente a diferença que um produto de qualidade pode fazer.</p>
+            
+            <h2>Conclusão</h2>
+            <p>O {nome} é mais que um produto - é uma solução completa que combina inovação, qualidade e preço justo. Não perca tempo e garante já o seu!</p>"""
+)
+
+_SIM_TAG_SETS = (
+    ("equipamento-escritorio", "tecnologia-avancada", "custo-beneficio", "review-2025"),
+    ("analise-tecnica", "especificacoes", "comparativo", "melhor-preco"),
+    ("guia-compra", "caracteristicas", "beneficios", "onde-comprar"),
+    ("review-completo", "pros-contras", "vale-a-pena", "investimento"),
+    ("tecnologia-2025", "inovacao", "sustentabilidade", "economia"),
+)
+
+# Sink de log do gerador - registrado uma única vez por processo
+_LOG_SINK_ID = None
+
+
+def _ensure_log_sink() -> None:
+    """Registra logs/generator.log apenas na primeira instância do gerador"""
+    global _LOG_SINK_ID
+    if _LOG_SINK_ID is None:
+        _LOG_SINK_ID = logger.add(
+            "logs/generator.log",
+            rotation="1 week",
+            retention="30 days",
+            level="INFO",
+            format="{time} | {level} | {message}"
+        )
+
+
+# Transições inseridas por _add_transition_words_yoast (segunda frase / última / demais)
+_TRANSITIONS_FIRST = ('Além disso', 'Também', 'Adicionalmente')
+_TRANSITIONS_LAST = ('Por fim', 'Finalmente', 'Em suma')
+_TRANSITIONS_MIDDLE = ('Dessa forma', 'Portanto', 'Consequentemente', 'Ainda assim')
+# Índice sorteado uma vez por frase; 12 é múltiplo de 3 e 4, então pick % len(lista) é uniforme
+_TRANSITION_PICK_RANGE = range(12)
+
+# Separador de frases compartilhado pelas etapas de frases e de transições
+_RE_SENTENCE_SPLIT = re.compile(r'[.!?]+')
+
+# Divisão de frases longas: transição usada ao quebrar em conjunção / ao cortar em 20 palavras
+_SPLIT_TRANSITIONS = ('Além disso', 'Dessa forma', 'Também')
+_CUT_TRANSITIONS = ('Além disso', 'Também', 'Ainda')
+
+# Concordância de artigos com substantivos
+_GENDER_MAP = {
+    'o Impressora': 'a Impressora',
+    'o impressora': 'a impressora',
+    'o multifuncional': 'a multifuncional',
+    'o Multifuncional': 'a Multifuncional',
+    'o escaner': 'o scanner',
+    'o Escaner': 'o Scanner',
+    'a toner': 'o toner',
+    'a Toner': 'o Toner',
+    'a papel': 'o papel',
+    'a Papel': 'o Papel',
+}
+
+# Voz passiva -> ativa (chaves em casefold - a busca ignora maiúsculas)
+_ACTIVE_VOICE_MAP = {
+    'é oferecido': 'oferece',
+    'são oferecidos': 'oferecem',
+    'é proporcionado': 'proporciona',
+    'são proporcionados': 'proporcionam',
+    'é garantido': 'garante',
+    'são garantidos': 'garantem',
+    'é recomendado': 'recomendamos',
+    'são recomendados': 'recomendamos',
+    'é utilizado': 'utiliza',
+    'são utilizados': 'utilizam',
+    'é considerado': 'consideramos',
+    'são considerados': 'consideramos',
+    'pode ser usado': 'você pode usar',
+    'podem ser usados': 'você pode usar',
+    'será beneficiado': 'você se beneficia',
+    'serão beneficiados': 'vocês se beneficiam',
+}
+_ACTIVE_VOICE_RE = re.compile(
+    '|'.join(re.escape(k) for k in sorted(_ACTIVE_VOICE_MAP, key=len, reverse=True)),
+    re.IGNORECASE
+)
+
+# Maiúsculas desnecessárias em expressões no meio da frase (início de frase é preservado)
+_CAPITAL_DICT = {
+    'Além Disso': 'Além disso',
+    'Em Um': 'Em um',
+    'Em Uma': 'Em uma',
+    'Por Isso': 'Por isso',
+    'Por Exemplo': 'Por exemplo',
+    'Dessa Forma': 'Dessa forma',
+    'No Entanto': 'No entanto',
+    'Por Outro Lado': 'Por outro lado',
+    'De Forma Geral': 'De forma geral',
+    'Em Comparação': 'Em comparação',
+    'Em Resumo': 'Em resumo',
+    'Ou Seja': 'Ou seja',
+    'Assim Sendo': 'Assim sendo',
+}
+
+# Maiúsculas e concordância em uma única varredura: os dois grupos nunca se sobrepõem
+# e nenhuma substituição cria ocorrência do outro. O lookahead pela primeira letra
+# evita avaliar os lookbehinds em todas as posições do texto
+_CAPITAL_GENDER_RE = re.compile(
+    '(?=[' + ''.join(sorted({k[0] for k in (*_CAPITAL_DICT, *_GENDER_MAP)})) + '])(?:'
+    '(?P<capital>(?<!^)(?<!\\. )(?<!\n)\\b(?:'
+    + '|'.join(re.escape(k) for k in sorted(_CAPITAL_DICT, key=len, reverse=True))
+    + ')\\b)'
+    '|(?P<gender>\\b(?:' + '|'.join(map(re.escape, _GENDER_MAP)) + ')\\b))'
+)
+_CAPITAL_GENDER_MAPS = {'capital': _CAPITAL_DICT, 'gender': _GENDER_MAP}
+
+# Domínios que a IA costuma quebrar ("blog. creativecopias. com. br") - o blog vem antes
+# do site para ter prioridade na alternância, como na ordem original das correções
+_URL_DOMAINS = {
+    'blog': 'blog.creativecopias.com.br',
+    'site': 'creativecopias.com.br',
+    'hp': 'www.hp.com',
+    'canon': 'www.canon.com',
+    'brother': 'www.brother.com',
+    'epson': 'www.epson.com',
+    'samsung': 'www.samsung.com',
+}
+
+
+def _domain_fix_re(separator: str, names: Iterable[str]) -> re.Pattern:
+    """Uma alternância com um grupo nomeado por domínio, rótulos unidos por separator"""
+    return re.compile('|'.join(
+        f'(?P<{name}>' + separator.join(map(re.escape, _URL_DOMAINS[name].split('.'))) + ')'
+        for name in names
+    ), re.IGNORECASE)
+
+
+# Primeira passada: "dominio. com" com um espaço após cada ponto (todos os domínios)
+_URL_DOMAIN_SPACED_RE = _domain_fix_re(r'\. ', _URL_DOMAINS)
+# Última passada: espaços em volta dos pontos ("blog . creativecopias . com . br")
+_URL_DOMAIN_LOOSE_RE = _domain_fix_re(r'\s*\.\s*', ('blog', 'site', 'hp', 'canon', 'brother', 'epson'))
+
+# Correções gerais de URLs, aplicadas entre as duas passadas de domínios. Com google-re2
+# instalado rodam em tempo linear (sem backtracking nos [^"]*? em respostas grandes);
+# flag inline porque a API do re2 não tem re.IGNORECASE
+_URL_FIXES = tuple(((re2 or re).compile('(?i)' + pattern), replacement) for pattern, replacement in (
+    # Corrigir padrões mais gerais
+    (r'(https?://[^"\s]*)\.\s+([^"\s/]*)\.\s+([^"\s/]*)', r'\1.\2.\3'),
+    (r'(https?://[^"\s]*)\.\s+([^"\s/]*)', r'\1.\2'),
+
+    # Corrigir espaços dentro de URLs (mais agressivo)
+    (r'(https?://[^"]*?)\s+([a-zA-Z0-9\-]+)\s+\.\s+([a-zA-Z0-9\-]+)\s+\.\s+([a-zA-Z]{2,})', r'\1\2.\3.\4'),
+    (r'(https?://[^"]*?)\s+([a-zA-Z0-9\-]+)\s+\.\s+([a-zA-Z]{2,})', r'\1\2.\3'),
+))
+_RE_HREF_VALUE = re.compile(r'href="([^"]*)"')
+# Tabela de remoção com os mesmos caracteres de \s (str.isspace - o último é U+3000)
+_WHITESPACE_DELETE = str.maketrans('', '', ''.join(c for c in map(chr, range(0x3001)) if c.isspace()))
+
+@lru_cache(maxsize=4096)
+def _extract_keyword(product_name: str) -> str:
+    """
+    Extrai keyword principal do nome do produto
+    
+    Args:
+        product_name: Nome completo do produto
+        
+    Returns:
+        Keyword otimizada (2-3 palavras principais)
+    """
+    if not product_name:
+        return "produto"
+    
+    # Limpar espaços e converter para minúsculas
+    clean_name = product_name.strip().lower()
+    
+    # Para produtos HP LaserJet, extrair marca + modelo específico
+    if 'hp' in clean_name and 'laserjet' in clean_name:
+        # Extrair modelo específico (ex: M404n, M404dn, etc.)
+        model_match = _RE_HP_MODEL.search(clean_name)
+        if model_match:
+            return f"hp laserjet {model_match.group(1)}"
+        else:
+            return 'hp laserjet'
+    
+    # Para outros produtos, extrair palavras significativas
+    words = clean_name.split()
+    
+    # Remover palavras irrelevantes
+    significant_words = []
+    
+    for word in words:
+        if (word not in _STOP_WORDS and 
+            len(word) > 2 and 
+            not word.isdigit() and 
+            word.isalpha()):  # Apenas palavras, não números/símbolos
+            significant_words.append(word)
+    
+    # Retornar 2 palavras principais
+    if len(significant_words) >= 2:
+        return ' '.join(significant_words[:2])
+    elif significant_words:
+        # Se só tem uma palavra significativa, tentar pegar do produto completo
+        # Priorizar marca + primeira palavra técnica
+        if 'hp' in words:
+            tech_words = [w for w in words if w not in _STOP_WORDS and w != 'hp' and len(w) > 3]
+            if tech_words:
+                return f"hp {tech_words[0]}"
+            else:
+                return 'hp impressora'
+        return significant_words[0]
+    else:
+        # Último fallback: extrair primeiras palavras do nome original
+        first_words = product_name.split()[:2]
+        return ' '.join(first_words).lower()
+
+
+@lru_cache(maxsize=1024)
+def _determine_type(nome: str, descricao: str) -> str:
+    """Tipo do produto a partir de nome e descrição (memoizado - produtos se repetem entre lotes)"""
+    text = f"{nome.lower()} {descricao.lower()}"
+    
+    # Primeiro tipo (em ordem de prioridade) com alguma palavra-chave no texto
+    for product_type, keywords in _PRODUCT_TYPE_KEYWORDS:
+        for keyword in keywords:
+            if keyword in text:
+                return product_type
+    
+    return 'produto_generico'
+
+
+def _openai_client_options(asynchronous: bool = False) -> Dict[str, Any]:
+    """
+    Opções do cliente OpenAI: pool de conexões keep-alive compartilhado e retentativas
+    
+    O próprio SDK refaz com backoff exponencial as chamadas que falham por 429, 5xx ou conexão.
+    Com asynchronous=True o pool é um httpx.AsyncClient, para uso com AsyncOpenAI.
+    """
+    options: Dict[str, Any] = {'max_retries': int(os.getenv('OPENAI_MAX_RETRIES', 5))}
+    if httpx is not None:
+        client_class = httpx.AsyncClient if asynchronous else httpx.Client
+        options['http_client'] = client_class(
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+            timeout=float(os.getenv('OPENAI_TIMEOUT', 60))
+        )
+    return options
+
+
+def _event_loop_running() -> bool:
+    """Indica se já há um event loop ativo nesta thread (asyncio.run não pode ser usado)"""
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+def _article_rng(product: Dict[str, Any]) -> random.Random:
+    """Gerador aleatório semeado pelo produto (semente em texto é estável entre processos)"""
+    return random.Random(str(product.get('id') or product.get('nome', '')))
+
+
+@lru_cache(maxsize=None)
+def _shared_components():
+    """Construtor de prompts, otimizador SEO, templates e base de produtos - criados uma vez por processo"""
+    return PromptBuilder(), SEOOptimizer(), TemplateManager(), ProductDatabase()
+
 
 class ContentGenerator:
     """Gerador principal de conteúdo SEO com IA"""
     
+    _stats_logged = False
+    
     def __init__(self, api_key: str = None, model: str = None, temperature: float = 0.7, max_tokens: int = 2000):
         """
         Inicializa o gerador de conteúdo
@@ -54,7 +529,7 @@ class ContentGenerator:
         
         # Sempre tentar inicializar o cliente OpenAI
         try:
-            self.client = OpenAI(api_key=self.api_key)
+            self.client = OpenAI(api_key=self.api_key, **_openai_client_options())
             logger.info("✅ Cliente OpenAI inicializado com sucesso")
         except Exception as e:
             logger.error(f"❌ Erro ao inicializar cliente OpenAI: {e}")
@@ -64,38 +539,31 @@ class ContentGenerator:
         self.temperature = temperature
         self.max_tokens = max_tokens
         
-        # Inicializar componentes
-        self.prompt_builder = PromptBuilder()
-        self.seo_optimizer = SEOOptimizer()
-        self.template_manager = TemplateManager()
-        self.product_database = ProductDatabase()  # NOVO: Base de produtos variados
-        
-        # Palavras de transição para legibilidade Yoast
-        self.transition_words = [
-            'além disso', 'portanto', 'por fim', 'ou seja', 'no entanto', 
-            'assim sendo', 'por outro lado', 'em primeiro lugar', 'finalmente',
-            'consequentemente', 'por exemplo', 'dessa forma', 'contudo',
-            'sobretudo', 'por isso', 'em suma', 'ainda assim', 'logo',
-            'principalmente', 'então', 'para isso', 'entretanto', 'ainda',
-            'de forma geral', 'em comparação', 'em resumo', 'adicionalmente'
-        ]
+        # Inicializar componentes (compartilhados entre instâncias - ver _shared_components)
+        self.prompt_builder, self.seo_optimizer, self.template_manager, self.product_database = _shared_components()
+        self.llm_cache = LLMCache()  # Respostas da IA por prompt idêntico
+        # Cache estrutural (opcional): reaproveita respostas de produtos com prompt equivalente
+        self.structural_cache = os.getenv('STRUCTURAL_CACHE', '0') == '1'
+        # Streaming da resposta (opcional): recebe o texto conforme é gerado
+        self.stream_responses = os.getenv('OPENAI_STREAM', '0') == '1'
+        # Cabeçalhos x-ratelimit-* da última resposta (espera entre artigos em _generate_articles_sequential)
+        self._last_headers = None
+        
+        # Prompt de sistema fixo - prefixo idêntico em todas as chamadas (cache de prompt da OpenAI)
+        self._static_system_prompt = self.prompt_builder.build_system_prompt(_TRANSITION_WORDS)
         
         # Configurar logging
-        logger.add(
-            "logs/generator.log",
-            rotation="1 week",
-            retention="30 days",
-            level="INFO",
-            format="{time} | {level} | {message}"
-        )
+        _ensure_log_sink()
         
         logger.info("🤖 Content Generator inicializado - Otimizado para Yoast Legibilidade")
         logger.info(f"📝 Modelo: {self.model} | Temperatura: {self.temperature} | Max Tokens: {self.max_tokens}")
         logger.info(f"🔧 Modo: {'Simulação' if self.simulation_mode else 'OpenAI API'}")
         
-        # Log da base de produtos
-        stats = self.product_database.get_statistics()
-        logger.info(f"📦 {stats['total_produtos']} produtos disponíveis: {stats['por_marca']}")
+        # Log da base de produtos (apenas na primeira instância)
+        if not ContentGenerator._stats_logged:
+            ContentGenerator._stats_logged = True
+            stats = self.product_database.get_statistics()
+            logger.info(f"📦 {stats['total_produtos']} produtos disponíveis: {stats['por_marca']}")
     
     def generate_article(self, product: Dict[str, Any], 
                         custom_keywords: List[str] = None,
@@ -141,7 +609,13 @@ class ContentGenerator:
             if self.simulation_mode:
                 ai_content = self._generate_simulated_content(product, template)
             else:
-                ai_content = self._generate_ai_content(prompt)
+                structural = self._structural_lookup(product, template, custom_keywords, custom_instructions, tone)
+                ai_content = structural[2] if structural else None
+                
+                if not ai_content:
+                    ai_content = self._generate_ai_content(prompt)
+                    if ai_content and structural:
+                        self._structural_store(structural[0], structural[1], ai_content)
                 
                 # Se falhou na API, usar simulação como fallback
                 if not ai_content:
@@ -152,40 +626,50 @@ class ContentGenerator:
                 logger.error("❌ Falha na geração de conteúdo")
                 return {}
             
-            # Processar e estruturar resposta
-            article_data = self._process_ai_response(ai_content, product)
-            
-            # NOVA OTIMIZAÇÃO: Aplicar melhorias de legibilidade Yoast
-            article_data = self._optimize_readability_yoast(article_data)
-            
-            # Otimizar SEO
-            article_data = self.seo_optimizer.optimize_article(article_data)
-            
-            # Adicionar metadados
-            article_data.update({
-                'produto_id': product.get('id'),
-                'produto_nome': product.get('nome'),
-                'produto_url': product.get('url'),
-                'data_geracao': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'tipo_produto': product_type,
-                'tom_usado': tone,
-                'modelo_ia': self.model,
-                'status': 'gerado'
-            })
-            
-            logger.info(f"✅ Artigo gerado com sucesso: {len(article_data.get('conteudo', ''))} caracteres")
-            return article_data
+            return self._finalize_article(ai_content, product, product_type, tone)
             
         except Exception as e:
             logger.error(f"❌ Erro na geração do artigo: {e}")
             return {}
     
-    def _optimize_readability_yoast(self, article_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _finalize_article(self, ai_content: str, product: Dict[str, Any],
+                          product_type: str, tone: str) -> Dict[str, Any]:
+        """Processa a resposta da IA, aplica otimizações Yoast/SEO e adiciona metadados"""
+        # Processar e estruturar resposta
+        article_data = self._process_ai_response(ai_content, product)
+        
+        # Sorteios do pós-processamento derivados do produto - mesmo produto, mesmo artigo
+        rng = _article_rng(product)
+        
+        # NOVA OTIMIZAÇÃO: Aplicar melhorias de legibilidade Yoast
+        article_data = self._optimize_readability_yoast(article_data, rng)
+        
+        # Otimizar SEO
+        article_data = self.seo_optimizer.optimize_article(article_data, rng)
+        
+        # Adicionar metadados
+        article_data.update({
+            'produto_id': product.get('id'),
+            'produto_nome': product.get('nome'),
+            'produto_url': product.get('url'),
+            'data_geracao': time.strftime(_TIMESTAMP_FORMAT),
+            'tipo_produto': product_type,
+            'tom_usado': tone,
+            'modelo_ia': self.model,
+            'status': 'gerado'
+        })
+        
+        logger.info(f"✅ Artigo gerado com sucesso: {len(article_data.get('conteudo', ''))} caracteres")
+        return article_data
+    
+    def _optimize_readability_yoast(self, article_data: Dict[str, Any],
+                                    rng: random.Random = None) -> Dict[str, Any]:
         """
         Aplica todas as otimizações de legibilidade para Yoast verde
         
         Args:
             article_data: Dados do artigo
+            rng: Gerador aleatório do artigo (padrão: módulo random)
             
         Returns:
             Artigo otimizado para legibilidade Yoast
@@ -202,26 +686,30 @@ class ContentGenerator:
                 # CRITICO 1: Garantir conteúdo mínimo de 300 palavras
                 content = self._ensure_minimum_content_length(content, optimized.get('produto_nome', ''))
                 
+                # CRITICO 2-5: links e keyword alteram apenas parágrafos - dividir o HTML uma única vez
+                parts = _split_paragraphs(content)
+                
                 # CRITICO 2: Adicionar links internos obrigatórios
-                content = self._add_mandatory_internal_links(content)
+                self._add_internal_link_to_parts(parts, rng)
                 
                 # CRITICO 3: Garantir links externos obrigatórios
-                content = self._ensure_external_links(content, optimized.get('produto_nome', ''))
+                self._add_external_link_to_parts(parts, optimized.get('produto_nome', ''))
                 
                 # CRITICO 4: Adicionar imagens com ALT contendo keyword
-                content = self._add_images_with_keyword_alt(content, optimized.get('produto_nome', ''))
+                # (desativado - ver _add_images_with_keyword_alt)
                 
                 # CRITICO 5: Garantir focus keyword no primeiro parágrafo
-                content = self._ensure_keyword_in_first_paragraph(content, optimized.get('produto_nome', ''))
+                self._add_keyword_to_first_paragraph_parts(parts, optimized.get('produto_nome', ''))
+                
+                content = _join_paragraphs(parts)
                 
                 # CRITICO 6: Limpar URLs malformadas (espaços extras)
                 content = self._clean_urls_in_content(content)
                 
                 # Aplicar otimizações de legibilidade existentes
-                content = self._optimize_sentence_length_yoast(content)
-                content = self._fix_unnecessary_capitals(content)
-                content = self._fix_article_gender_agreement(content)
-                content = self._add_transition_words_yoast(content)
+                content = self._optimize_sentence_length_yoast(content, rng)
+                content = self._fix_capitals_and_gender_agreement(content)
+                content = self._add_transition_words_yoast(content, rng)
                 content = self._optimize_lists_yoast(content, optimized.get('produto_nome', ''))
                 content = self._optimize_paragraph_length_yoast(content)
                 content = self._convert_to_active_voice(content)
@@ -263,8 +751,7 @@ class ContentGenerator:
             Conteúdo expandido se necessário
         """
         # Contar palavras no texto (sem HTML)
-        text_only = re.sub(r'<[^>]+>', '', content)
-        word_count = len(text_only.split())
+        word_count = _count_words_in_html(content)
         
         if word_count < 300:
             # Adicionar conteúdo extra para atingir 300+ palavras
@@ -283,57 +770,25 @@ class ContentGenerator:
 
     def _generate_additional_content(self, product_name: str, words_needed: int) -> str:
         """Gera conteúdo adicional para atingir contagem mínima"""
-        sections = [
-            f"""
-            <h3>Vantagens do {product_name} para Seu Escritório</h3>
-            <p>O {product_name} oferece benefícios específicos para ambientes profissionais. Além disso, sua 
-            tecnologia avançada garante produtividade constante. Portanto, é uma escolha inteligente para 
-            empresas que buscam eficiência. Em primeiro lugar, destaca-se pela confiabilidade operacional.</p>
-            """,
-            f"""
-            <h3>Especificações Técnicas Detalhadas</h3>
-            <ul>
-                <li>Tecnologia de impressão laser de alta precisão</li>
-                <li>Velocidade otimizada para volumes médios e altos</li>
-                <li>Conectividade USB e rede Ethernet</li>
-                <li>Compatibilidade universal com sistemas Windows e Mac</li>
-                <li>Ciclo de trabalho mensal robusto</li>
-            </ul>
-            <p>Essas características técnicas fazem do {product_name} uma solução completa. Consequentemente, 
-            atende às demandas mais exigentes do mercado corporativo.</p>
-            """,
-            f"""
-            <h3>Comparativo com Concorrentes</h3>
-            <p>Em comparação com outros modelos do mercado, o {product_name} se destaca. Por exemplo, 
-            oferece melhor custo-benefício na categoria. Também apresenta menor consumo energético. 
-            Finalmente, sua manutenção é mais simples e econômica.</p>
-            """
-        ]
+        
+        name_words = len(product_name.split())
         
         # Selecionar seções baseado nas palavras necessárias
-        result = ""
-        for section in sections:
-            result += section
-            section_words = len(re.sub(r'<[^>]+>', '', section).split())
+        result = []
+        for section, (fixed_words, name_count) in zip(_ADDITIONAL_SECTIONS, _ADDITIONAL_SECTION_WORDS):
+            result.append(section.replace('{product_name}', product_name))
+            section_words = fixed_words + name_count * name_words
             words_needed -= section_words
             if words_needed <= 0:
                 break
         
-        return result
+        return ''.join(result)
 
-    def _add_mandatory_internal_links(self, content: str) -> str:
-        """
-        Adiciona pelo menos 1 link interno obrigatório
-        
-        Args:
-            content: Conteúdo HTML
-            
-        Returns:
-            Conteúdo com link interno
-        """
+    def _add_internal_link_to_parts(self, parts: List[str], rng: random.Random = None) -> None:
+        """Adiciona pelo menos 1 link interno obrigatório ao HTML já dividido por _split_paragraphs (altera parts)"""
         # Verificar se já tem link interno
-        if 'blog.creativecopias.com.br' in content or 'creativecopias.com.br' in content:
-            return content
+        if any('creativecopias.com.br' in part for part in parts):
+            return
         
         # Links internos para adicionar
         internal_links = [
@@ -343,40 +798,30 @@ class ContentGenerator:
             '<a href="https://blog.creativecopias.com.br/contato/" target="_blank">entre em contato conosco</a> para mais informações'
         ]
         
-        link_to_add = random.choice(internal_links)
+        link_to_add = (rng or random).choice(internal_links)
         
         # Inserir no primeiro parágrafo que tenha conteúdo suficiente
-        paragraphs = re.findall(r'<p>(.*?)</p>', content, re.DOTALL)
-        if paragraphs:
-            for i, paragraph in enumerate(paragraphs):
-                if len(paragraph.split()) > 15:  # Parágrafo com conteúdo suficiente
+        if len(parts) > 1:
+            for i in range(1, len(parts), 2):
+                if len(parts[i].split()) > 15:  # Parágrafo com conteúdo suficiente
                     # Adicionar link no final do parágrafo
-                    enhanced_p = paragraph.rstrip() + f'. Para mais opções, {link_to_add}.'
-                    content = content.replace(f'<p>{paragraph}</p>', f'<p>{enhanced_p}</p>', 1)
+                    parts[i] = parts[i].rstrip() + f'. Para mais opções, {link_to_add}.'
                     break
         else:
             # Se não encontrar parágrafos, adicionar no final
-            content += f'<p>Para mais opções, {link_to_add}.</p>'
-        
-        return content
+            parts.extend([f'Para mais opções, {link_to_add}.', ''])
 
-    def _ensure_external_links(self, content: str, product_name: str) -> str:
-        """
-        Garante pelo menos 1 link externo obrigatório
-        
-        Args:
-            content: Conteúdo HTML
-            product_name: Nome do produto
-            
-        Returns:
-            Conteúdo com link externo
-        """
+    def _add_external_link_to_parts(self, parts: List[str], product_name: str) -> None:
+        """Garante pelo menos 1 link externo obrigatório no HTML já dividido por _split_paragraphs (altera parts)"""
         # Verificar se já tem link externo não Creative Cópias
-        external_links_present = re.findall(r'href="(https?://[^"]+)"', content)
-        has_external = any(link for link in external_links_present if 'creativecopias.com' not in link)
+        has_external = any(
+            'creativecopias.com' not in link
+            for part in parts
+            for link in _RE_HREF.findall(part)
+        )
         
         if has_external:
-            return content
+            return
         
         # Determinar link externo baseado na marca
         brand_links = {
@@ -390,30 +835,24 @@ class ContentGenerator:
         
         # Detectar marca no nome do produto
         brand = 'hp'  # Default
+        name_lower = product_name.lower()
         for brand_name in brand_links.keys():
-            if brand_name.lower() in product_name.lower():
+            if brand_name in name_lower:
                 brand = brand_name
                 break
         
         external_link = f'<a href="{brand_links[brand]}" target="_blank" rel="nofollow">site oficial da {brand.upper()}</a>'
         
         # Inserir no segundo parágrafo se disponível
-        paragraphs = re.findall(r'<p>(.*?)</p>', content, re.DOTALL)
-        if len(paragraphs) >= 2 and len(paragraphs[1].split()) > 10:
+        if len(parts) > 3 and len(parts[3].split()) > 10:
             # Adicionar no final do segundo parágrafo
-            second_p = paragraphs[1]
-            enhanced_p = second_p.rstrip() + f' Mais detalhes técnicos estão disponíveis no {external_link}.'
-            content = content.replace(f'<p>{second_p}</p>', f'<p>{enhanced_p}</p>', 1)
-        elif paragraphs and len(paragraphs[0].split()) > 10:
+            parts[3] = parts[3].rstrip() + f' Mais detalhes técnicos estão disponíveis no {external_link}.'
+        elif len(parts) > 1 and len(parts[1].split()) > 10:
             # Se só tem um parágrafo, adicionar nele
-            first_p = paragraphs[0]
-            enhanced_p = first_p.rstrip() + f' Consulte também o {external_link} para informações adicionais.'
-            content = content.replace(f'<p>{first_p}</p>', f'<p>{enhanced_p}</p>', 1)
+            parts[1] = parts[1].rstrip() + f' Consulte também o {external_link} para informações adicionais.'
         else:
             # Se não encontrar parágrafos adequados, adicionar no final
-            content += f'<p>Consulte o {external_link} para mais informações técnicas.</p>'
-        
-        return content
+            parts.extend([f'Consulte o {external_link} para mais informações técnicas.', ''])
 
     def _add_images_with_keyword_alt(self, content: str, product_name: str) -> str:
         """
@@ -430,23 +869,13 @@ class ContentGenerator:
         # Não adicionar nem modificar imagens automaticamente
         return content
 
-    def _ensure_keyword_in_first_paragraph(self, content: str, product_name: str) -> str:
-        """
-        Garante que a keyword aparece no primeiro parágrafo (primeiros 100 caracteres)
-        
-        Args:
-            content: Conteúdo HTML
-            product_name: Nome do produto
-            
-        Returns:
-            Conteúdo com keyword no início
-        """
-        keyword = self._extract_keyword_from_product(product_name)
+    def _add_keyword_to_first_paragraph_parts(self, parts: List[str], product_name: str) -> None:
+        """Garante a keyword no primeiro parágrafo (primeiros 100 caracteres) do HTML já dividido (altera parts)"""
+        keyword = _extract_keyword(product_name)
         
         # Encontrar primeiro parágrafo
-        first_p_match = re.search(r'<p>(.*?)</p>', content, re.DOTALL)
-        if first_p_match:
-            first_p = first_p_match.group(1).strip()
+        if len(parts) > 1:
+            first_p = parts[1].strip()
             
             # Verificar se keyword já está nos primeiros 100 caracteres
             first_100 = first_p[:100].lower()
@@ -455,13 +884,14 @@ class ContentGenerator:
                 sentences = first_p.split('. ')
                 if sentences:
                     # Corrigir o artigo baseado no tipo de produto
-                    if any(word in product_name.lower() for word in ['impressora', 'multifuncional', 'copiadora']):
+                    name_lower = product_name.lower()
+                    if any(word in name_lower for word in ['impressora', 'multifuncional', 'copiadora']):
                         article = "A"
                     else:
                         article = "O"
                     
                     # Gerar link de compra do produto
-                    product_slug = re.sub(r'[^a-z0-9]+', '-', product_name.lower()).strip('-')
+                    product_slug = re.sub(r'[^a-z0-9]+', '-', name_lower).strip('-')
                     buy_link = f'<a href="https://creativecopias.com.br/produto/{product_slug}" target="_blank" rel="noopener"><strong>Comprar {product_name}</strong></a>'
                     
                     # VALIDAÇÃO CRÍTICA: Verificar se product_name não está vazio
@@ -476,9 +906,7 @@ class ContentGenerator:
                     else:
                         enhanced_p = new_first_sentence + '. ' + sentences[0] + f' Para comprar, acesse: {buy_link}.'
                     
-                    content = content.replace(f'<p>{first_p}</p>', f'<p>{enhanced_p}</p>', 1)
-        
-        return content
+                    parts[1] = enhanced_p
 
     def _optimize_title_for_yoast_green(self, title: str, product_name: str) -> str:
         """
@@ -491,7 +919,7 @@ class ContentGenerator:
         Returns:
             Título otimizado para Yoast verde
         """
-        keyword = self._extract_keyword_from_product(product_name)
+        keyword = _extract_keyword(product_name)
         
         # Usar o produto completo no título, não só keyword
         if not title.lower().startswith(product_name.lower()[:20]):  # Primeiras palavras do produto
@@ -526,7 +954,7 @@ class ContentGenerator:
         Returns:
             Meta description otimizada
         """
-        keyword = self._extract_keyword_from_product(product_name)
+        keyword = _extract_keyword(product_name)
         
         # Usar produto completo, mas limitar tamanho
         product_short = product_name[:30] if len(product_name) > 30 else product_name
@@ -555,67 +983,9 @@ class ContentGenerator:
         Returns:
             Focus keyword otimizada
         """
-        return self._extract_keyword_from_product(product_name)
+        return _extract_keyword(product_name)
 
-    def _extract_keyword_from_product(self, product_name: str) -> str:
-        """
-        Extrai keyword principal do nome do produto
-        
-        Args:
-            product_name: Nome completo do produto
-            
-        Returns:
-            Keyword otimizada (2-3 palavras principais)
-        """
-        if not product_name:
-            return "produto"
-        
-        # Limpar espaços e converter para minúsculas
-        clean_name = product_name.strip().lower()
-        
-        # Para produtos HP LaserJet, extrair marca + modelo específico
-        if 'hp' in clean_name and 'laserjet' in clean_name:
-            # Extrair modelo específico (ex: M404n, M404dn, etc.)
-            import re
-            model_match = re.search(r'(m\d+\w*)', clean_name)
-            if model_match:
-                return f"hp laserjet {model_match.group(1)}"
-            else:
-                return 'hp laserjet'
-        
-        # Para outros produtos, extrair palavras significativas
-        words = clean_name.split()
-        
-        # Remover palavras irrelevantes
-        stop_words = ['a', 'o', 'de', 'da', 'do', 'com', 'para', 'em', 'na', 'no', 'impressora', 'multifuncional']
-        significant_words = []
-        
-        for word in words:
-            if (word not in stop_words and 
-                len(word) > 2 and 
-                not word.isdigit() and 
-                word.isalpha()):  # Apenas palavras, não números/símbolos
-                significant_words.append(word)
-        
-        # Retornar 2 palavras principais
-        if len(significant_words) >= 2:
-            return ' '.join(significant_words[:2])
-        elif significant_words:
-            # Se só tem uma palavra significativa, tentar pegar do produto completo
-            # Priorizar marca + primeira palavra técnica
-            if 'hp' in words:
-                tech_words = [w for w in words if w not in stop_words and w != 'hp' and len(w) > 3]
-                if tech_words:
-                    return f"hp {tech_words[0]}"
-                else:
-                    return 'hp impressora'
-            return significant_words[0]
-        else:
-            # Último fallback: extrair primeiras palavras do nome original
-            first_words = product_name.split()[:2]
-            return ' '.join(first_words).lower()
-    
-    def _optimize_sentence_length_yoast(self, content: str) -> str:
+    def _optimize_sentence_length_yoast(self, content: str, rng: random.Random = None) -> str:
         """Limita frases a máximo 20 palavras para Yoast verde"""
         if not content:
             return content
@@ -630,29 +1000,29 @@ class ContentGenerator:
                 continue
             
             # Dividir em frases
-            sentences = re.split(r'[.!?]+', paragraph)
+            sentences = [(sentence.strip(), sentence.split()) for sentence in _RE_SENTENCE_SPLIT.split(paragraph)]
             optimized_sentences = []
             
-            for sentence in sentences:
-                sentence = sentence.strip()
+            # Sortear de uma vez as transições das frases longas (uma por frase dividida)
+            long_count = sum(1 for _, words in sentences if len(words) > 20)
+            picks = iter((rng or random).choices(range(3), k=long_count)) if long_count else None
+            
+            for sentence, words in sentences:
                 if not sentence:
                     continue
                 
-                words = sentence.split()
-                
                 # Se a frase tem mais de 20 palavras, dividir
                 if len(words) > 20:
+                    pick = next(picks)
                     # Tentar dividir em conjunções
-                    connectors = ['e', 'mas', 'porém', 'contudo', 'entretanto', 'no entanto', 'todavia']
-                    
                     for i, word in enumerate(words):
-                        if word.lower() in connectors and i > 8 and i < len(words) - 3:
+                        if word.lower() in _CONNECTORS and i > 8 and i < len(words) - 3:
                             # Dividir aqui
                             first_part = ' '.join(words[:i])
                             second_part = ' '.join(words[i+1:])
                             
                             # Adicionar palavra de transição na segunda parte
-                            transition = random.choice(['Além disso', 'Dessa forma', 'Também'])
+                            transition = _SPLIT_TRANSITIONS[pick]
                             second_part = f"{transition}, {second_part.lower()}"
                             
                             optimized_sentences.append(first_part + '.')
@@ -665,7 +1035,7 @@ class ContentGenerator:
                         
                         optimized_sentences.append(first_part + '.')
                         if remaining:
-                            transition = random.choice(['Além disso', 'Também', 'Ainda'])
+                            transition = _CUT_TRANSITIONS[pick]
                             optimized_sentences.append(f"{transition}, {remaining.lower()}.")
                 else:
                     optimized_sentences.append(sentence + '.')
@@ -674,64 +1044,24 @@ class ContentGenerator:
         
         return '\n'.join(optimized_paragraphs)
     
-    def _fix_unnecessary_capitals(self, content: str) -> str:
-        """Corrige maiúsculas desnecessárias no meio de frases"""
-        if not content:
-            return content
-        
-        # Padrões a corrigir
-        patterns = [
-            (r'\b(Além Disso)\b', 'Além disso'),
-            (r'\b(Em Um)\b', 'Em um'),
-            (r'\b(Em Uma)\b', 'Em uma'),
-            (r'\b(Por Isso)\b', 'Por isso'),
-            (r'\b(Por Exemplo)\b', 'Por exemplo'),
-            (r'\b(Dessa Forma)\b', 'Dessa forma'),
-            (r'\b(No Entanto)\b', 'No entanto'),
-            (r'\b(Por Outro Lado)\b', 'Por outro lado'),
-            (r'\b(De Forma Geral)\b', 'De forma geral'),
-            (r'\b(Em Comparação)\b', 'Em comparação'),
-            (r'\b(Em Resumo)\b', 'Em resumo'),
-            (r'\b(Ou Seja)\b', 'Ou seja'),
-            (r'\b(Assim Sendo)\b', 'Assim sendo'),
-        ]
-        
-        # Aplicar correções (exceto no início de frases)
-        for pattern, replacement in patterns:
-            # Não corrigir se estiver no início de uma frase (após ponto/quebra de linha)
-            content = re.sub(f'(?<!^)(?<!\. )(?<!\n){pattern}', replacement, content)
-        
-        return content
-    
-    def _fix_article_gender_agreement(self, content: str) -> str:
-        """Corrige concordância de artigos com substantivos"""
+    def _fix_capitals_and_gender_agreement(self, content: str) -> str:
+        """Corrige maiúsculas desnecessárias no meio de frases e concordância de artigos com substantivos"""
         if not content:
             return content
         
-        # Correções específicas comuns
-        corrections = [
-            (r'\bo Impressora\b', 'a Impressora'),
-            (r'\bo impressora\b', 'a impressora'),
-            (r'\bo multifuncional\b', 'a multifuncional'),
-            (r'\bo Multifuncional\b', 'a Multifuncional'),
-            (r'\bo escaner\b', 'o scanner'),
-            (r'\bo Escaner\b', 'o Scanner'),
-            (r'\ba toner\b', 'o toner'),
-            (r'\ba Toner\b', 'o Toner'),
-            (r'\ba papel\b', 'o papel'),
-            (r'\ba Papel\b', 'o Papel'),
-        ]
-        
-        for pattern, replacement in corrections:
-            content = re.sub(pattern, replacement, content)
-        
-        return content
+        # Uma varredura para as duas correções (ver _CAPITAL_GENDER_RE) - início de frases é preservado
+        return _CAPITAL_GENDER_RE.sub(
+            lambda m: _CAPITAL_GENDER_MAPS[m.lastgroup][m.group(0)], content
+        )
     
-    def _add_transition_words_yoast(self, content: str) -> str:
+    def _add_transition_words_yoast(self, content: str, rng: random.Random = None) -> str:
         """Adiciona palavras de transição para atingir 30% das frases (Yoast verde)"""
-        if not content:
+        # Sem pontuação final não há parágrafo com mais de uma frase para alterar
+        if not content or not ('.' in content or '!' in content or '?' in content):
             return content
         
+        chooser = rng or random
+        
         paragraphs = content.split('\n')
         optimized_paragraphs = []
         
@@ -740,8 +1070,7 @@ class ContentGenerator:
                 optimized_paragraphs.append(paragraph)
                 continue
             
-            sentences = re.split(r'[.!?]+', paragraph)
-            sentences = [s.strip() for s in sentences if s.strip()]
+            sentences = [s for s in map(str.strip, _RE_SENTENCE_SPLIT.split(paragraph)) if s]
             
             if len(sentences) <= 1:
                 optimized_paragraphs.append(paragraph)
@@ -751,22 +1080,26 @@ class ContentGenerator:
             transition_count = max(1, int(len(sentences) * 0.3))
             
             # Selecionar frases aleatórias para adicionar transições (exceto a primeira)
-            sentences_to_modify = random.sample(range(1, len(sentences)), min(transition_count, len(sentences)-1))
+            sentences_to_modify = chooser.sample(range(1, len(sentences)), min(transition_count, len(sentences)-1))
+            
+            # Sortear de uma vez as transições de todas as frases selecionadas
+            picks = chooser.choices(_TRANSITION_PICK_RANGE, k=len(sentences_to_modify))
             
-            for i in sentences_to_modify:
+            for i, pick in zip(sentences_to_modify, picks):
                 sentence = sentences[i]
                 
                 # Verificar se já tem palavra de transição
-                has_transition = any(trans in sentence.lower() for trans in self.transition_words)
+                has_transition = _TRANSITION_RE.search(sentence.lower()) is not None
                 
                 if not has_transition:
                     # Escolher transição baseada na posição
                     if i == 1:
-                        transition = random.choice(['Além disso', 'Também', 'Adicionalmente'])
+                        pool = _TRANSITIONS_FIRST
                     elif i == len(sentences) - 1:
-                        transition = random.choice(['Por fim', 'Finalmente', 'Em suma'])
+                        pool = _TRANSITIONS_LAST
                     else:
-                        transition = random.choice(['Dessa forma', 'Portanto', 'Consequentemente', 'Ainda assim'])
+                        pool = _TRANSITIONS_MIDDLE
+                    transition = pool[pick % len(pool)]
                     
                     # Adicionar transição
                     sentences[i] = f"{transition}, {sentence.lower()}"
@@ -777,31 +1110,31 @@ class ContentGenerator:
     
     def _optimize_lists_yoast(self, content: str, product_name: str) -> str:
         """Otimiza listas com pelo menos 3 bullets e conteúdo real"""
-        if not content:
+        if not content or '<ul>' not in content:
             return content
         
         # Buscar listas existentes e melhorá-las
-        list_pattern = r'<ul>(.*?)</ul>'
+        name_lower = product_name.lower()  # uma vez para todas as listas do artigo
         
         def improve_list(match):
             list_content = match.group(1)
-            items = re.findall(r'<li>(.*?)</li>', list_content)
+            items = _RE_LI.findall(list_content)
             
             if len(items) < 3:
                 # Adicionar mais itens baseado no tipo de produto
-                if 'impressora' in product_name.lower():
+                if 'impressora' in name_lower:
                     additional_items = [
                         'Conectividade USB e Ethernet integrada',
                         'Baixo consumo de energia em modo standby',
                         'Compatibilidade com sistemas Windows e Mac'
                     ]
-                elif 'multifuncional' in product_name.lower():
+                elif 'multifuncional' in name_lower:
                     additional_items = [
                         'Scanner com resolução óptica superior',
                         'Copiadora com zoom automático',
                         'Fax com memória de documentos'
                     ]
-                elif 'toner' in product_name.lower():
+                elif 'toner' in name_lower:
                     additional_items = [
                         'Alto rendimento de páginas por cartucho',
                         'Qualidade de impressão profissional',
@@ -827,20 +1160,16 @@ class ContentGenerator:
                 optimized_items.append(item)
             
             # Reconstruir lista
-            new_list = '<ul>\n'
-            for item in optimized_items:
-                new_list += f'   <li>{item}</li>\n'
-            new_list += '</ul>'
-            
-            return new_list
+            return '<ul>\n' + ''.join(f'   <li>{item}</li>\n' for item in optimized_items) + '</ul>'
         
-        content = re.sub(list_pattern, improve_list, content, flags=re.DOTALL)
+        content = _RE_UL_LIST.sub(improve_list, content)
         
         return content
     
     def _optimize_paragraph_length_yoast(self, content: str) -> str:
         """Garante que parágrafos tenham máximo 100 palavras"""
-        if not content:
+        # Parágrafo único com até 200 caracteres não chega a 101 palavras - nada a dividir
+        if not content or (len(content) <= 200 and '\n' not in content):
             return content
         
         paragraphs = content.split('\n')
@@ -859,23 +1188,37 @@ class ContentGenerator:
                 # Dividir em parágrafos menores
                 chunks = []
                 current_chunk = []
+                # Acompanhados a cada palavra (sem refazer o join): tamanho de ' '.join(current_chunk),
+                # posição do último ponto nesse texto e palavra/deslocamento onde ele está
+                chunk_len = 0
+                last_period = -1
+                period_word = period_offset = 0
                 
                 for word in words:
+                    start = chunk_len + 1 if current_chunk else 0
                     current_chunk.append(word)
+                    chunk_len = start + len(word)
+                    
+                    dot = word.rfind('.')
+                    if dot >= 0:
+                        last_period = start + dot
+                        period_word, period_offset = len(current_chunk) - 1, dot
                     
                     if len(current_chunk) >= 90:
-                        # Procurar ponto para quebrar
-                        chunk_text = ' '.join(current_chunk)
-                        last_period = chunk_text.rfind('.')
-                        
+                        # Quebrar no último ponto
                         if last_period > 50:  # Se encontrou um ponto em posição razoável
-                            chunks.append(chunk_text[:last_period + 1])
-                            remaining = chunk_text[last_period + 1:].strip()
-                            current_chunk = remaining.split() if remaining else []
+                            head = current_chunk[period_word]
+                            chunks.append(' '.join(current_chunk[:period_word] + [head[:period_offset + 1]]))
+                            tail = head[period_offset + 1:]
+                            current_chunk = ([tail] if tail else []) + current_chunk[period_word + 1:]
+                            chunk_len = len(' '.join(current_chunk))
+                            last_period = -1
                         elif len(current_chunk) >= 100:
                             # Forçar quebra se não encontrou ponto
                             chunks.append(' '.join(current_chunk))
                             current_chunk = []
+                            chunk_len = 0
+                            last_period = -1
                 
                 if current_chunk:
                     chunks.append(' '.join(current_chunk))
@@ -889,30 +1232,8 @@ class ContentGenerator:
         if not content:
             return content
         
-        # Padrões de voz passiva para ativa
-        patterns = [
-            (r'é oferecido', 'oferece'),
-            (r'são oferecidos', 'oferecem'),
-            (r'é proporcionado', 'proporciona'),
-            (r'são proporcionados', 'proporcionam'),
-            (r'é garantido', 'garante'),
-            (r'são garantidos', 'garantem'),
-            (r'é recomendado', 'recomendamos'),
-            (r'são recomendados', 'recomendamos'),
-            (r'é utilizado', 'utiliza'),
-            (r'são utilizados', 'utilizam'),
-            (r'é considerado', 'consideramos'),
-            (r'são considerados', 'consideramos'),
-            (r'pode ser usado', 'você pode usar'),
-            (r'podem ser usados', 'você pode usar'),
-            (r'será beneficiado', 'você se beneficia'),
-            (r'serão beneficiados', 'vocês se beneficiam'),
-        ]
-        
-        for passive, active in patterns:
-            content = re.sub(passive, active, content, flags=re.IGNORECASE)
-        
-        return content
+        # Padrões de voz passiva para ativa (ver _ACTIVE_VOICE_MAP) - uma única varredura
+        return _ACTIVE_VOICE_RE.sub(lambda m: _ACTIVE_VOICE_MAP[m.group(0).casefold()], content)
     
     def _optimize_title_length_yoast(self, title: str) -> str:
         """Otimiza título para máximo 60 caracteres"""
@@ -958,17 +1279,66 @@ class ContentGenerator:
         return meta_desc
     
     def generate_articles_batch(self, products: List[Dict[str, Any]], 
+                               max_concurrent: int = 5,
                                **kwargs) -> List[Dict[str, Any]]:
         """
         Gera artigos para múltiplos produtos
         
+        Com a API real as chamadas são feitas em paralelo: com asyncio (generate_articles_concurrent)
+        ou, dentro de um event loop já ativo, em threads (_generate_articles_threaded).
+        Em modo simulação, sequencialmente.
+        
         Args:
             products: Lista de produtos
+            max_concurrent: Máximo de requisições simultâneas à OpenAI
             **kwargs: Argumentos para generate_article
             
         Returns:
             Lista de artigos gerados
         """
+        if not self.simulation_mode:
+            if AsyncOpenAI is not None and not _event_loop_running():
+                return self.generate_articles_concurrent(products, max_concurrent=max_concurrent, **kwargs)
+            if max_concurrent > 1 and len(products) > 1:
+                return self._generate_articles_threaded(products, max_workers=max_concurrent, **kwargs)
+        
+        return self._generate_articles_sequential(products, **kwargs)
+    
+    def _generate_articles_threaded(self, products: List[Dict[str, Any]], max_workers: int = 5,
+                                    **kwargs) -> List[Dict[str, Any]]:
+        """
+        Gera os artigos com generate_article em um pool de threads
+        
+        As chamadas à OpenAI dominam o tempo e liberam o GIL enquanto aguardam a rede;
+        o número de workers limita as requisições simultâneas e o cliente repete as
+        que receberem 429 (ver _openai_client_options).
+        """
+        logger.info(f"⚡ Iniciando geração em {min(max_workers, len(products))} threads de {len(products)} artigos")
+        
+        def run(numbered):
+            i, product = numbered
+            try:
+                return self.generate_article(product, **kwargs)
+            except Exception as e:
+                logger.error(f"❌ Erro no artigo {i}: {e}")
+                return None
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(products))) as executor:
+            results = list(executor.map(run, enumerate(products, 1)))
+        
+        articles = []
+        for i, article in enumerate(results, 1):
+            if article:
+                articles.append(article)
+            else:
+                logger.warning(f"⚠️ Falha na geração do artigo {i}")
+        
+        logger.info(f"✅ Geração em threads concluída: {len(articles)}/{len(products)} artigos")
+        return articles
+    
+    def _generate_articles_sequential(self, products: List[Dict[str, Any]],
+                                      **kwargs) -> List[Dict[str, Any]]:
+        """Gera os artigos um a um com generate_article"""
         logger.info(f"🔄 Iniciando geração em lote de {len(products)} artigos")
         
         articles = []
@@ -982,10 +1352,12 @@ class ContentGenerator:
                 else:
                     logger.warning(f"⚠️ Falha na geração do artigo {i}")
                 
-                # Delay entre gerações para não sobrecarregar API
+                # Espera só quando a cota de requisições está perto do fim (ver delay_from_headers)
                 if not self.simulation_mode and i < len(products):
-                    import time
-                    time.sleep(2)
+                    delay = delay_from_headers(self._last_headers)
+                    if delay > 0:
+                        logger.info(f"⏳ Limite de requisições próximo - aguardando {delay:.1f}s")
+                        time.sleep(delay)
                     
             except Exception as e:
                 logger.error(f"❌ Erro no artigo {i}: {e}")
@@ -996,6 +1368,165 @@ class ContentGenerator:
         
         return articles
     
+    def _prepare_prompt(self, product: Dict[str, Any], custom_keywords: List[str] = None,
+                        custom_instructions: str = None, tone: str = "profissional"):
+        """Determina tipo, template e prompt de um produto (etapas anteriores à chamada da IA)"""
+        product_type = self._determine_product_type(product)
+        template = self.template_manager.get_template(product_type)
+        prompt = self.prompt_builder.build_prompt(
+            product=product,
+            template=template,
+            custom_keywords=custom_keywords,
+            custom_instructions=custom_instructions,
+            tone=tone
+        )
+        return product_type, template, prompt
+    
+    def generate_articles_concurrent(self, products: List[Dict[str, Any]],
+                                     max_concurrent: int = 20, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Gera artigos com chamadas simultâneas à OpenAI (uso em contexto síncrono)
+        
+        Dentro de um event loop já ativo use ``await agenerate_articles(...)``.
+        
+        Args:
+            products: Lista de produtos
+            max_concurrent: Máximo de requisições simultâneas
+            **kwargs: Argumentos para agenerate_articles
+            
+        Returns:
+            Lista de artigos gerados
+        """
+        return asyncio.run(self.agenerate_articles(products, max_concurrent=max_concurrent, **kwargs))
+    
+    async def agenerate_articles(self, products: List[Dict[str, Any]],
+                                 max_concurrent: int = 20,
+                                 rpm: int = None,
+                                 tpm: int = None,
+                                 **kwargs) -> List[Dict[str, Any]]:
+        """
+        Gera artigos em paralelo respeitando limites de concorrência, RPM e TPM
+        
+        Args:
+            products: Lista de produtos
+            max_concurrent: Máximo de requisições simultâneas
+            rpm: Requisições por minuto (padrão: OPENAI_RPM ou 500)
+            tpm: Tokens por minuto (padrão: OPENAI_TPM ou 200000)
+            **kwargs: Argumentos para agenerate_article
+            
+        Returns:
+            Lista de artigos gerados (na ordem dos produtos)
+        """
+        if self.simulation_mode or AsyncOpenAI is None:
+            logger.info("🎭 Modo simulação - gerando sequencialmente")
+            return self._generate_articles_sequential(products, **kwargs)
+        
+        logger.info(f"⚡ Iniciando geração concorrente de {len(products)} artigos (máx. {max_concurrent} simultâneas)")
+        
+        semaphore = asyncio.Semaphore(max_concurrent)
+        limiter = AsyncLimiter(
+            rpm=rpm or int(os.getenv('OPENAI_RPM', 500)),
+            tpm=tpm or int(os.getenv('OPENAI_TPM', 200000))
+        )
+        
+        # Retentativas ficam só no laço de _agenerate_ai_content, que passa pelo limitador a cada tentativa
+        client_options = _openai_client_options(asynchronous=True)
+        client_options['max_retries'] = 0
+        
+        async with AsyncOpenAI(api_key=self.api_key, **client_options) as aclient:
+            async def run(product):
+                async with semaphore:
+                    return await self.agenerate_article(product, aclient=aclient, limiter=limiter, **kwargs)
+            
+            results = await asyncio.gather(*(run(product) for product in products), return_exceptions=True)
+        
+        articles = []
+        for i, result in enumerate(results, 1):
+            if isinstance(result, Exception):
+                logger.error(f"❌ Erro no artigo {i}: {result}")
+            elif result:
+                articles.append(result)
+            else:
+                logger.warning(f"⚠️ Falha na geração do artigo {i}")
+        
+        logger.info(f"✅ Geração concorrente concluída: {len(articles)}/{len(products)} artigos")
+        return articles
+    
+    async def agenerate_article(self, product: Dict[str, Any],
+                                aclient,
+                                limiter: AsyncLimiter = None,
+                                custom_keywords: List[str] = None,
+                                custom_instructions: str = None,
+                                tone: str = "profissional") -> Dict[str, Any]:
+        """Versão assíncrona de generate_article usando um cliente AsyncOpenAI compartilhado"""
+        if not self._validate_product(product):
+            logger.error("❌ Produto inválido para geração de conteúdo")
+            return {}
+        
+        product_type, template, prompt = self._prepare_prompt(
+            product, custom_keywords, custom_instructions, tone
+        )
+        
+        structural = self._structural_lookup(product, template, custom_keywords, custom_instructions, tone)
+        ai_content = structural[2] if structural else None
+        
+        if not ai_content:
+            ai_content = await self._agenerate_ai_content(aclient, prompt, limiter)
+            if ai_content and structural:
+                self._structural_store(structural[0], structural[1], ai_content)
+        
+        if not ai_content:
+            logger.warning("🎭 API falhou, usando conteúdo simulado como fallback")
+            ai_content = self._generate_simulated_content(product, template)
+        
+        # Pós-processamento é CPU puro - executa no próprio loop
+        return self._finalize_article(ai_content, product, product_type, tone)
+    
+    async def _agenerate_ai_content(self, aclient, prompt: str, limiter: AsyncLimiter = None,
+                                    max_retries: int = None) -> Optional[str]:
+        """Gera conteúdo com AsyncOpenAI, com retry e backoff exponencial em 429/5xx"""
+        # Mesmo número de retentativas do cliente síncrono (OPENAI_MAX_RETRIES) além da primeira chamada
+        if max_retries is None:
+            max_retries = int(os.getenv('OPENAI_MAX_RETRIES', 5)) + 1
+        
+        cache_key = self._llm_cache_key(prompt)
+        cached = self.llm_cache.get(cache_key)
+        if cached:
+            logger.info("⚡ Resposta da IA servida do cache")
+            return cached
+        
+        # Estimativa simples: ~4 caracteres por token no prompt + resposta máxima
+        estimated_tokens = len(prompt) // 4 + self.max_tokens
+        
+        for attempt in range(max_retries):
+            try:
+                if limiter:
+                    await limiter.acquire(estimated_tokens)
+                
+                response = await aclient.chat.completions.create(**self._build_completion_body(prompt))
+                content = response.choices[0].message.content.strip()
+                logger.info(f"✅ Resposta da OpenAI recebida: {len(content)} caracteres")
+                self.llm_cache.set(cache_key, content)
+                return content
+                
+            except (RateLimitError, APIConnectionError) as e:
+                error = e
+            except APIStatusError as e:
+                if e.status_code < 500:
+                    logger.error(f"❌ Erro na API OpenAI: {type(e).__name__}: {e}")
+                    return None
+                error = e
+            except Exception as e:
+                logger.error(f"❌ Erro na API OpenAI: {type(e).__name__}: {e}")
+                return None
+            
+            delay = min(60, 2 ** attempt + random.random())
+            logger.warning(f"⏳ {type(error).__name__} - nova tentativa em {delay:.1f}s ({attempt + 1}/{max_retries})")
+            await asyncio.sleep(delay)
+        
+        logger.error("❌ Tentativas esgotadas na API OpenAI")
+        return None
+    
     def _validate_product(self, product: Dict[str, Any]) -> bool:
         """Valida se produto tem dados suficientes para gerar conteúdo"""
         required_fields = ['nome']
@@ -1003,27 +1534,7 @@ class ContentGenerator:
     
     def _determine_product_type(self, product: Dict[str, Any]) -> str:
         """Determina o tipo/categoria do produto baseado nos dados"""
-        nome = product.get('nome', '').lower()
-        descricao = product.get('descricao', '').lower()
-        text = f"{nome} {descricao}"
-        
-        # Mapeamento de palavras-chave para tipos
-        type_keywords = {
-            'impressora': ['impressora', 'printer'],
-            'multifuncional': ['multifuncional', 'multifun', 'all-in-one'],
-            'toner': ['toner', 'cartucho'],
-            'papel': ['papel', 'resma'],
-            'scanner': ['scanner', 'digitalizador'],
-            'copiadora': ['copiadora', 'copier'],
-            'fax': ['fax'],
-            'suprimento': ['suprimento', 'supply']
-        }
-        
-        for product_type, keywords in type_keywords.items():
-            if any(keyword in text for keyword in keywords):
-                return product_type
-        
-        return 'produto_generico'
+        return _determine_type(product.get('nome', ''), product.get('descricao', ''))
     
     def _generate_ai_content(self, prompt: str) -> Optional[str]:
         """Gera conteúdo usando OpenAI API"""
@@ -1035,20 +1546,27 @@ class ContentGenerator:
                 logger.error("❌ Cliente OpenAI não inicializado!")
                 return None
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "Você é um especialista em redação publicitária e SEO para produtos de escritório, especialmente impressoras e suprimentos."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens
+            cache_key = self._llm_cache_key(prompt)
+            cached = self.llm_cache.get(cache_key)
+            if cached:
+                logger.info("⚡ Resposta da IA servida do cache")
+                return cached
+            
+            # Resposta bruta para guardar os cabeçalhos de limite junto com o conteúdo
+            raw = self.client.chat.completions.with_raw_response.create(
+                **self._build_completion_body(prompt), stream=self.stream_responses
             )
+            self._last_headers = raw.headers
+            
+            if self.stream_responses:
+                content = self._collect_stream(raw.parse())
+            else:
+                content = raw.parse().choices[0].message.content.strip()
             
-            content = response.choices[0].message.content.strip()
             logger.info(f"✅ Resposta da OpenAI recebida: {len(content)} caracteres")
             logger.debug(f"📄 Conteúdo: {content[:200]}...")
             
+            self.llm_cache.set(cache_key, content)
             return content
             
         except Exception as e:
@@ -1059,6 +1577,91 @@ class ContentGenerator:
             logger.warning("🎭 Usando conteúdo simulado como fallback")
             return None
     
+    def _collect_stream(self, stream) -> str:
+        """
+        Acumula os fragmentos de uma resposta em streaming
+        
+        O pós-processamento Yoast só roda com o artigo completo: a resposta é um JSON
+        e as etapas dependem da ordem (links, transições aleatórias, divisão de frases).
+        """
+        started = time.monotonic()
+        buffer = io.StringIO()
+        first_chunk = True
+        
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            if first_chunk:
+                logger.debug(f"⚡ Primeiro fragmento da OpenAI em {time.monotonic() - started:.2f}s")
+                first_chunk = False
+            buffer.write(delta)
+        
+        return buffer.getvalue().strip()
+    
+    def _structural_lookup(self, product: Dict[str, Any], template: Dict[str, Any],
+                           custom_keywords: List[str] = None, custom_instructions: str = None,
+                           tone: str = "profissional"):
+        """
+        Consulta o cache estrutural (STRUCTURAL_CACHE=1)
+        
+        Returns:
+            None se desativado, senão (chave, marcadores, conteúdo preenchido ou None)
+        """
+        if not self.structural_cache:
+            return None
+        
+        skeleton, slots = self.prompt_builder.build_prompt_skeleton(
+            product, template, custom_keywords, custom_instructions, tone
+        )
+        key = self._llm_cache_key('structural|' + skeleton)
+        
+        cached = self.llm_cache.get(key)
+        if not cached:
+            return key, slots, None
+        
+        # Sem código de modelo no produto atual, usar o nome completo
+        fill = dict(slots)
+        if not fill[SLOT_MODEL]:
+            fill[SLOT_MODEL] = fill[SLOT_PRODUCT_NAME]
+        
+        content = cached
+        for slot, value in fill.items():
+            content = content.replace(slot, value)
+        
+        logger.info("⚡ Resposta reaproveitada do cache estrutural")
+        return key, slots, content
+    
+    def _structural_store(self, key: str, slots: Dict[str, str], ai_content: str) -> None:
+        """Armazena a resposta com os dados do produto trocados por marcadores"""
+        templated = ai_content
+        # Valores mais longos primeiro: o nome contém marca e modelo
+        for slot, value in sorted(slots.items(), key=lambda item: len(item[1]), reverse=True):
+            if len(value) < 2:
+                continue
+            templated = re.sub(rf'(?<!\w){re.escape(value)}(?!\w)', slot, templated)
+        
+        self.llm_cache.set(key, templated)
+    
+    def _llm_cache_key(self, prompt: str) -> str:
+        """Chave do cache de respostas: modelo, parâmetros de amostragem, prompt de sistema e prompt"""
+        return LLMCache.key(self.model, self.temperature, self.max_tokens, prompt,
+                            self._static_system_prompt)
+    
+    def _build_completion_body(self, prompt: str) -> Dict[str, Any]:
+        """Parâmetros de chat.completions usados tanto na chamada síncrona quanto na assíncrona (agenerate_articles)"""
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": self._static_system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens
+        }
+    
     def _generate_simulated_content(self, product: Dict[str, Any], template: Dict[str, Any]) -> str:
         """Gera conteúdo simulado para testes (quando API não disponível)"""
         nome = product.get('nome', 'Produto')
@@ -1066,128 +1669,20 @@ class ContentGenerator:
         preco = product.get('preco', {})
         preco_texto = preco.get('texto', 'Consulte o preço') if isinstance(preco, dict) else str(preco)
         
-        # VARIAÇÕES DE TÍTULOS PARA EVITAR DUPLICATAS
-        title_variations = [
-            f"{nome}: Análise Completa 2025",
-            f"{nome}: Guia de Compra Definitivo",
-            f"{nome}: Vale a Pena? Review Detalhado",
-            f"{nome}: Características e Benefícios",
-            f"Review: {nome} - Prós e Contras",
-            f"Como Escolher: {nome}",
-            f"Tudo Sobre o {nome}",
-            f"{nome}: Especificações Técnicas",
-            f"Análise: {nome} da {marca}",
-            f"{nome}: Melhor Custo-Benefício?"
-        ]
+        # Variações em nível de módulo - só a escolhida é preenchida
+        fields = {'nome': nome, 'marca': marca, 'preco_texto': preco_texto}
         
-        # Escolher título aleatório
-        titulo_seo = random.choice(title_variations)
+        # Escolher título aleatório (VARIAÇÕES DE TÍTULOS PARA EVITAR DUPLICATAS)
+        titulo_seo = random.choice(_SIM_TITLES).format(**fields)
         
         # VARIAÇÕES DE META DESCRIÇÃO
-        meta_variations = [
-            f"Descubra tudo sobre o {nome}: análise completa, especificações técnicas e onde comprar com melhor preço.",
-            f"Review detalhado do {nome}: características, benefícios e comparação com concorrentes. Confira!",
-            f"Guia completo do {nome}: vale a pena? Análise de prós, contras e custo-benefício.",
-            f"Conheça o {nome}: especificações, preços e avaliação especializada. Tudo que você precisa saber.",
-            f"Análise técnica do {nome}: performance, qualidade e comparativo de preços no mercado."
-        ]
+        meta_desc = random.choice(_SIM_META_DESCRIPTIONS).format(**fields)
         
-        meta_desc = random.choice(meta_variations)
-        
-        # VARIAÇÕES DE ESTRUTURA DE CONTEÚDO
-        content_structures = [
-            # Estrutura 1: Foco em benefícios
-            f"""<h1>{titulo_seo}</h1>
-            
-            <h2>Por que escolher o {nome}?</h2>
-            <p>O {nome} da {marca} se destaca no mercado por oferecer uma combinação única de qualidade, performance e custo-benefício. Com tecnologia avançada e design moderno, este produto atende às necessidades de usuários exigentes.</p>
-            
-            <h2>Principais Características</h2>
-            <ul>
-                <li><strong>Tecnologia Avançada:</strong> Equipado com os mais modernos recursos</li>
-                <li><strong>Design Ergonômico:</strong> Pensado para máximo conforto de uso</li>
-                <li><strong>Eficiência Energética:</strong> Consumo otimizado e sustentável</li>
-                <li><strong>Conectividade:</strong> Múltiplas opções de conexão</li>
-                <li><strong>Durabilidade:</strong> Construção robusta para uso intensivo</li>
-            </ul>
-            
-            <h2>Benefícios para o Usuário</h2>
-            <p>Ao escolher o {nome}, você investe em produtividade e qualidade. Este equipamento oferece resultados superiores, reduzindo custos operacionais e aumentando a eficiência do trabalho.</p>
-            
-            <h3>Economia Garantida</h3>
-            <p>Com tecnologia de ponta, o {nome} proporciona economia de até 40% nos custos operacionais, tornando-se um investimento inteligente para empresas e usuários domésticos.</p>
-            
-            <h2>Onde Comprar</h2>
-            <p>O {nome} está disponível nas principais lojas especializadas. Preço atual: {preco_texto}. Aproveite as condições especiais e garante já o seu!</p>""",
-            
-            # Estrutura 2: Foco técnico
-            f"""<h1>{titulo_seo}</h1>
-            
-            <h2>Especificações Técnicas do {nome}</h2>
-            <p>O {nome} representa o que há de mais moderno em tecnologia. Desenvolvido pela {marca}, este produto incorpora inovações que garantem performance superior e confiabilidade.</p>
-            
-            <h2>Recursos Avançados</h2>
-            <h3>Tecnologia de Ponta</h3>
-            <p>Equipado com processamento avançado e componentes de alta qualidade, o {nome} oferece desempenho excepcional em todas as condições de uso.</p>
-            
-            <h3>Conectividade Inteligente</h3>
-            <ul>
-                <li>Conexão Wi-Fi integrada</li>
-                <li>Compatibilidade universal</li>
-                <li>Interface intuitiva</li>
-                <li>Configuração simplificada</li>
-            </ul>
-            
-            <h2>Performance e Qualidade</h2>
-            <p>Com velocidade otimizada e qualidade superior, o {nome} atende às demandas mais exigentes do mercado profissional e doméstico.</p>
-            
-            <h3>Sustentabilidade</h3>
-            <p>Desenvolvido com foco na sustentabilidade, o {nome} utiliza tecnologias eco-friendly que reduzem o impacto ambiental sem comprometer a performance.</p>
-            
-            <h2>Investimento Inteligente</h2>
-            <p>Por {preco_texto}, o {nome} oferece excelente custo-benefício, combinando tecnologia avançada com preço competitivo.</p>""",
-            
-            # Estrutura 3: Foco comparativo
-            f"""<h1>{titulo_seo}</h1>
-            
-            <h2>O {nome} é a Melhor Escolha?</h2>
-            <p>Em um mercado competitivo, o {nome} da {marca} se destaca pela combinação única de recursos, qualidade e preço acessível.</p>
-            
-            <h2>Vantagens Competitivas</h2>
-            <h3>Superioridade Técnica</h3>
-            <p>Comparado aos concorrentes, o {nome} oferece recursos exclusivos que garantem melhor desempenho e maior durabilidade.</p>
-            
-            <h3>Custo-Benefício Imbatível</h3>
-            <ul>
-                <li><strong>Preço competitivo:</strong> {preco_texto}</li>
-                <li><strong>Baixo custo operacional:</strong> Economia de até 50%</li>
-                <li><strong>Manutenção reduzida:</strong> Componentes duráveis</li>
-                <li><strong>Garantia estendida:</strong> Proteção total</li>
-            </ul>
-            
-            <h2>Por que Escolher o {nome}?</h2>
-            <p>A escolha do {nome} representa um investimento seguro em tecnologia e qualidade. Com recursos avançados e suporte técnico especializado, você tem a garantia de um produto confiável.</p>
-            
-            <h3>Satisfação Garantida</h3>
-            <p>Milhares de usuários já comprovaram a qualidade do {nome}. Junte-se a eles e experimente a diferença que um produto de qualidade pode fazer.</p>
-            
-            <h2>Conclusão</h2>
-            <p>O {nome} é mais que um produto - é uma solução completa que combina inovação, qualidade e preço justo. Não perca tempo e garante já o seu!</p>"""
-        ]
-        
-        # Escolher estrutura aleatória
-        content_html = random.choice(content_structures)
+        # Escolher estrutura aleatória (VARIAÇÕES DE ESTRUTURA DE CONTEÚDO)
+        content_html = random.choice(_SIM_CONTENT_STRUCTURES).format(titulo_seo=titulo_seo, **fields)
         
         # TAGS VARIADAS E ESPECÍFICAS
-        tag_sets = [
-            [nome.lower().replace(' ', '-'), marca.lower(), "equipamento-escritorio", "tecnologia-avancada", "custo-beneficio", "review-2025"],
-            [nome.lower().replace(' ', '-'), marca.lower(), "analise-tecnica", "especificacoes", "comparativo", "melhor-preco"],
-            [nome.lower().replace(' ', '-'), marca.lower(), "guia-compra", "caracteristicas", "beneficios", "onde-comprar"],
-            [nome.lower().replace(' ', '-'), marca.lower(), "review-completo", "pros-contras", "vale-a-pena", "investimento"],
-            [nome.lower().replace(' ', '-'), marca.lower(), "tecnologia-2025", "inovacao", "sustentabilidade", "economia"]
-        ]
-        
-        tags_seo = random.choice(tag_sets)
+        tags_seo = [nome.lower().replace(' ', '-'), marca.lower(), *random.choice(_SIM_TAG_SETS)]
         
         # Criar estrutura de dados diretamente
         article_data = {
@@ -1198,7 +1693,10 @@ class ContentGenerator:
         }
         
         # Converter para JSON para consistência com API
-        content = json.dumps(article_data, ensure_ascii=False, indent=2)
+        if orjson:
+            content = orjson.dumps(article_data, option=orjson.OPT_INDENT_2).decode('utf-8')
+        else:
+            content = json.dumps(article_data, ensure_ascii=False, indent=2)
         
         logger.info(f"🎭 Conteúdo simulado SEO otimizado gerado: {titulo_seo}")
         return content
@@ -1206,11 +1704,13 @@ class ContentGenerator:
     def _process_ai_response(self, ai_content: str, product: Dict[str, Any]) -> Dict[str, Any]:
         """Processa resposta da IA e extrai dados estruturados"""
         try:
-            # Tentar extrair JSON da resposta
-            json_match = re.search(r'\{.*\}', ai_content, re.DOTALL)
-            if json_match:
-                json_str = json_match.group()
-                article_data = json.loads(json_str)
+            # Tentar extrair JSON da resposta (do primeiro '{' ao último '}')
+            start = ai_content.find('{')
+            end = ai_content.rfind('}')
+            if start != -1 and end > start:
+                json_str = ai_content[start:end + 1]
+                # orjson.JSONDecodeError herda de json.JSONDecodeError - tratado abaixo
+                article_data = orjson.loads(json_str) if orjson else json.loads(json_str)
             else:
                 # Se não for JSON, estruturar manualmente
                 article_data = self._parse_text_response(ai_content, product)
@@ -1327,26 +1827,19 @@ class ContentGenerator:
         """
         logger.info(f"🔄 Gerando lote de {count} artigos com produtos variados")
         
-        articles = []
+        # Sortear todos os produtos antes - a geração do lote é feita em paralelo
+        products = []
         for i in range(count):
             try:
-                logger.info(f"📝 Gerando artigo {i+1}/{count}")
-                
-                article = self.generate_article_from_random_product(**kwargs)
-                if article:
-                    articles.append(article)
-                    logger.info(f"✅ Artigo {i+1} gerado: {article.get('titulo', 'Sem título')[:50]}...")
-                else:
-                    logger.warning(f"⚠️ Falha na geração do artigo {i+1}")
-                
-                # Delay entre gerações
-                if not self.simulation_mode and i < count - 1:
-                    import time
-                    time.sleep(1)
-                    
+                # FORÇAR RESET DOS PRODUTOS USADOS para garantir variedade
+                self.product_database.reset_used_products()
+                product = self.product_database.get_random_product(exclude_used=True)
+                logger.info(f"🎲 Produto {i+1}/{count}: {product['nome']} ({product['marca']})")
+                products.append(product)
             except Exception as e:
-                logger.error(f"❌ Erro no artigo {i+1}: {e}")
-                continue
+                logger.error(f"❌ Erro ao selecionar produto {i+1}: {e}")
+        
+        articles = self.generate_articles_batch(products, **kwargs)
         
         success_rate = len(articles) / count * 100 if count > 0 else 0
         logger.info(f"✅ Lote concluído: {len(articles)}/{count} artigos ({success_rate:.1f}%)")
@@ -1363,53 +1856,38 @@ class ContentGenerator:
         Returns:
             Conteúdo com URLs corrigidas
         """
-        if not content:
+        # Todo padrão de domínio tem um ponto e o último passo só olha href="..."
+        if not content or ('.' not in content and 'href="' not in content):
             return content
         
-        # Primeira passada: Corrigir padrões específicos conhecidos
-        url_fixes = [
-            # Corrigir espaços específicos conhecidos
-            (r'blog\. creativecopias\. com\. br', 'blog.creativecopias.com.br'),
-            (r'creativecopias\. com\. br', 'creativecopias.com.br'),
-            (r'www\. hp\. com', 'www.hp.com'),
-            (r'www\. canon\. com', 'www.canon.com'),
-            (r'www\. brother\. com', 'www.brother.com'),
-            (r'www\. epson\. com', 'www.epson.com'),
-            (r'www\. samsung\. com', 'www.samsung.com'),
-            
-            # Corrigir padrões mais gerais
-            (r'(https?://[^"\s]*)\.\s+([^"\s/]*)\.\s+([^"\s/]*)', r'\1.\2.\3'),
-            (r'(https?://[^"\s]*)\.\s+([^"\s/]*)', r'\1.\2'),
-            
-            # Corrigir espaços dentro de URLs (mais agressivo)
-            (r'(https?://[^"]*?)\s+([a-zA-Z0-9\-]+)\s+\.\s+([a-zA-Z0-9\-]+)\s+\.\s+([a-zA-Z]{2,})', r'\1\2.\3.\4'),
-            (r'(https?://[^"]*?)\s+([a-zA-Z0-9\-]+)\s+\.\s+([a-zA-Z]{2,})', r'\1\2.\3'),
-            
-            # Corrigir padrão específico que aparece: "blog . creativecopias . com . br"
-            (r'blog\s*\.\s*creativecopias\s*\.\s*com\s*\.\s*br', 'blog.creativecopias.com.br'),
-            (r'creativecopias\s*\.\s*com\s*\.\s*br', 'creativecopias.com.br'),
-            (r'www\s*\.\s*hp\s*\.\s*com', 'www.hp.com'),
-            (r'www\s*\.\s*canon\s*\.\s*com', 'www.canon.com'),
-            (r'www\s*\.\s*brother\s*\.\s*com', 'www.brother.com'),
-            (r'www\s*\.\s*epson\s*\.\s*com', 'www.epson.com'),
-        ]
+        def fix_domain(match):
+            return _URL_DOMAINS[match.lastgroup]
         
+        # Primeira passada: Corrigir padrões específicos conhecidos
+        # (cada alternância substitui as correções de domínio uma a uma em uma só varredura)
+        # Cada passada só roda se o texto tiver o trecho literal que todos os seus padrões exigem
         cleaned_content = content
+        if '. ' in cleaned_content:
+            cleaned_content = _URL_DOMAIN_SPACED_RE.sub(fix_domain, cleaned_content)
+        
+        if '://' in cleaned_content:
+            for pattern, replacement in _URL_FIXES:
+                cleaned_content = pattern.sub(replacement, cleaned_content)
         
-        # Aplicar todas as correções
-        for pattern, replacement in url_fixes:
-            cleaned_content = re.sub(pattern, replacement, cleaned_content, flags=re.IGNORECASE)
+        # Corrigir padrão específico que aparece: "blog . creativecopias . com . br"
+        # (também normaliza maiúsculas - por isso não depende de haver espaços)
+        if '.' in cleaned_content:
+            cleaned_content = _URL_DOMAIN_LOOSE_RE.sub(fix_domain, cleaned_content)
         
         # Segunda passada: Remover qualquer espaço restante em URLs
         # Encontrar todas as URLs e corrigir espaços internos
         def fix_url_spaces(match):
-            url = match.group(1)
             # Remover todos os espaços da URL
-            fixed_url = re.sub(r'\s+', '', url)
-            return f'href="{fixed_url}"'
+            return f'href="{match.group(1).translate(_WHITESPACE_DELETE)}"'
         
         # Aplicar correção em todas as URLs encontradas
-        cleaned_content = re.sub(r'href="([^"]*)"', fix_url_spaces, cleaned_content)
+        if 'href="' in cleaned_content:
+            cleaned_content = _RE_HREF_VALUE.sub(fix_url_spaces, cleaned_content)
         
         return cleaned_content
 
@@ -1425,7 +1903,6 @@ class ContentGenerator:
         """
         logger.info(f"🎨 Gerando {count} artigos com marcas diversas")
         
-        articles = []
         used_brands = set()
         
         # Resetar produtos usados
@@ -1437,47 +1914,15 @@ class ContentGenerator:
         
         logger.info(f"📊 Marcas disponíveis: {available_brands}")
         
-        for i in range(count):
-            try:
-                # Tentar conseguir produto de marca ainda não usada
-                product = None
-                attempts = 0
-                max_attempts = 10
-                
-                while attempts < max_attempts:
-                    candidate_product = self.product_database.get_random_product(exclude_used=True)
-                    
-                    # Se a marca ainda não foi usada, ou se já tentamos muito, usar este produto
-                    if candidate_product['marca'] not in used_brands or attempts >= 5:
-                        product = candidate_product
-                        break
-                    
-                    attempts += 1
-                
-                if not product:
-                    logger.warning(f"⚠️ Não foi possível encontrar produto único para artigo {i+1}")
-                    continue
-                
-                # Marcar marca como usada
-                used_brands.add(product['marca'])
-                
-                logger.info(f"📝 Artigo {i+1}/{count}: {product['marca']} {product['nome']}")
-                
-                # Gerar artigo
-                article = self.generate_article(product)
-                if article:
-                    articles.append(article)
-                else:
-                    logger.warning(f"⚠️ Falha na geração do artigo {i+1}")
-                
-                # Delay entre gerações
-                if not self.simulation_mode and i < count - 1:
-                    import time
-                    time.sleep(1)
-                    
-            except Exception as e:
-                logger.error(f"❌ Erro no artigo {i+1}: {e}")
-                continue
+        # Uma marca diferente por artigo enquanto houver marcas (random.sample sobre o índice por marca)
+        products = self.product_database.get_products_diverse_brands(count)
+        
+        for i, product in enumerate(products, 1):
+            used_brands.add(product['marca'])
+            logger.info(f"📝 Artigo {i}/{count}: {product['marca']} {product['nome']}")
+        
+        # Gerar artigos (em paralelo com a API real)
+        articles = self.generate_articles_batch(products)
         
         success_rate = len(articles) / count * 100 if count > 0 else 0
         logger.info(f"✅ Geração diversa concluída: {len(articles)}/{count} artigos ({success_rate:.1f}%)")
@@ -6,11 +6,14 @@ Orquestrador principal que coordena todo o processo de geração de conteúdo
 import os
 import time
 import json
+import threading
+from collections import deque
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 from loguru import logger
 
 from .content_generator import ContentGenerator
+from ._cache import ResponseCache, make_key
 
 class GeneratorManager:
     """Gerenciador principal do módulo de geração de conteúdo"""
@@ -29,13 +32,23 @@ class GeneratorManager:
             temperature=temperature,
             max_tokens=max_tokens
         )
-        self.generated_articles = []
+        # Instância compartilhada entre requisições - manter só os últimos artigos
+        self.generated_articles = deque(maxlen=100)
+        # Cache de artigos por produto/parâmetros (opcional, GENERATOR_CACHE_TTL) - sem ele cada
+        # pedido gera um artigo novo
+        self.cache = ResponseCache()
         self.stats = {
             'total_generated': 0,
             'successful_generations': 0,
             'failed_generations': 0,
             'simulation_mode': self.content_generator.simulation_mode
         }
+        # Estatísticas do review para get_stats (dashboard consulta a cada poucos segundos)
+        self._review_manager = None
+        self._review_stats = None
+        self._review_stats_at = 0.0
+        self._review_stats_ttl = float(os.getenv('REVIEW_STATS_TTL', 2))
+        self._review_lock = threading.Lock()
         
         logger.info("🎨 Generator Manager inicializado com sucesso")
     
@@ -45,7 +58,20 @@ class GeneratorManager:
             logger.info(f"🎨 Iniciando geração para: {product.get('nome', 'Produto')}")
             
             start_time = time.time()
-            article = self.content_generator.generate_article(product, **kwargs)
+            cache_key = make_key(
+                product, kwargs,
+                self.content_generator.model,
+                self.content_generator.temperature,
+                self.content_generator.max_tokens
+            )
+            article = self.cache.get(cache_key)
+            
+            if article:
+                logger.info("⚡ Artigo servido do cache")
+            else:
+                article = self.content_generator.generate_article(product, **kwargs)
+                if article:
+                    self.cache.set(cache_key, article)
             
             if article:
                 generation_time = time.time() - start_time
@@ -77,18 +103,30 @@ class GeneratorManager:
         
         return self.generate_article_from_product(mock_product)
     
+    def _get_review_statistics(self) -> Optional[Dict[str, Any]]:
+        """Estatísticas do review com uma instância de ReviewManager reaproveitada e cache curto"""
+        with self._review_lock:
+            if self._review_stats is not None and time.monotonic() - self._review_stats_at < self._review_stats_ttl:
+                return self._review_stats
+            
+            try:
+                if self._review_manager is None:
+                    from src.review.review_manager import ReviewManager
+                    self._review_manager = ReviewManager()
+                review_data = self._review_manager.get_statistics()
+            except Exception as e:
+                logger.warning(f"Não foi possível obter dados do review: {e}")
+                return None
+            
+            self._review_stats = review_data if review_data else None
+            self._review_stats_at = time.monotonic()
+            return self._review_stats
+    
     def get_stats(self) -> Dict[str, Any]:
         """Retorna estatísticas do gerador incluindo dados do banco"""
         try:
             # Tentar obter dados do sistema review
-            review_stats = None
-            try:
-                from src.review.review_manager import ReviewManager
-                review_manager = ReviewManager()
-                review_data = review_manager.get_statistics()
-                review_stats = review_data if review_data else None
-            except Exception as e:
-                logger.warning(f"Não foi possível obter dados do review: {e}")
+            review_stats = self._get_review_statistics()
             
             # Calcular estatísticas reais
             total_articles_db = review_stats.get('total_artigos', 0) if review_stats else 0
@@ -5,9 +5,263 @@ Base de dados de produtos variados para geração de artigos
 """
 
 import random
-from typing import Dict, List, Any
+from collections import Counter, defaultdict
+from typing import Dict, List, Any, Tuple
 from loguru import logger
 
+
+def _build_products() -> List[Dict[str, Any]]:
+    """Monta o catálogo estático de produtos (uma vez, na importação do módulo)"""
+    
+    products = []
+    
+    # IMPRESSORAS HP
+    hp_printers = [
+        {
+            'nome': 'HP LaserJet Pro M404n',
+            'marca': 'HP',
+            'preco': 'R$ 899,00',
+            'descricao': 'Impressora laser monocromática profissional para escritórios',
+            'tipo': 'impressora',
+            'categoria': 'laser-mono'
+        },
+        {
+            'nome': 'HP LaserJet Pro M404dn',
+            'marca': 'HP', 
+            'preco': 'R$ 1.199,00',
+            'descricao': 'Impressora laser monocromática com duplex automático',
+            'tipo': 'impressora',
+            'categoria': 'laser-mono'
+        },
+        {
+            'nome': 'HP LaserJet Pro M428fdw',
+            'marca': 'HP',
+            'preco': 'R$ 1.899,00',
+            'descricao': 'Multifuncional laser monocromática com Wi-Fi e fax',
+            'tipo': 'multifuncional',
+            'categoria': 'laser-mono'
+        },
+        {
+            'nome': 'HP Color LaserJet Pro M454dn',
+            'marca': 'HP',
+            'preco': 'R$ 2.299,00',
+            'descricao': 'Impressora laser colorida profissional com duplex',
+            'tipo': 'impressora',
+            'categoria': 'laser-color'
+        },
+        {
+            'nome': 'HP DeskJet Ink Advantage 2774',
+            'marca': 'HP',
+            'preco': 'R$ 449,00',
+            'descricao': 'Multifuncional jato de tinta com Wi-Fi para home office',
+            'tipo': 'multifuncional',
+            'categoria': 'jato-tinta'
+        },
+        {
+            'nome': 'HP OfficeJet Pro 9012e',
+            'marca': 'HP',
+            'preco': 'R$ 1.349,00',
+            'descricao': 'Multifuncional jato de tinta profissional com HP+',
+            'tipo': 'multifuncional',
+            'categoria': 'jato-tinta'
+        }
+    ]
+    
+    # IMPRESSORAS CANON
+    canon_printers = [
+        {
+            'nome': 'Canon PIXMA G3111',
+            'marca': 'Canon',
+            'preco': 'R$ 699,00',
+            'descricao': 'Multifuncional tanque de tinta com Wi-Fi',
+            'tipo': 'multifuncional',
+            'categoria': 'tanque-tinta'
+        },
+        {
+            'nome': 'Canon PIXMA G4111',
+            'marca': 'Canon',
+            'preco': 'R$ 849,00',
+            'descricao': 'Multifuncional tanque de tinta com fax e ADF',
+            'tipo': 'multifuncional',
+            'categoria': 'tanque-tinta'
+        },
+        {
+            'nome': 'Canon imageCLASS LBP6030',
+            'marca': 'Canon',
+            'preco': 'R$ 579,00',
+            'descricao': 'Impressora laser monocromática compacta',
+            'tipo': 'impressora',
+            'categoria': 'laser-mono'
+        },
+        {
+            'nome': 'Canon imageCLASS MF3010',
+            'marca': 'Canon',
+            'preco': 'R$ 899,00',
+            'descricao': 'Multifuncional laser monocromática',
+            'tipo': 'multifuncional',
+            'categoria': 'laser-mono'
+        },
+        {
+            'nome': 'Canon PIXMA TS3150',
+            'marca': 'Canon',
+            'preco': 'R$ 329,00',
+            'descricao': 'Multifuncional jato de tinta com Wi-Fi',
+            'tipo': 'multifuncional',
+            'categoria': 'jato-tinta'
+        }
+    ]
+    
+    # IMPRESSORAS EPSON
+    epson_printers = [
+        {
+            'nome': 'Epson L3150',
+            'marca': 'Epson',
+            'preco': 'R$ 649,00',
+            'descricao': 'Multifuncional EcoTank com Wi-Fi',
+            'tipo': 'multifuncional',
+            'categoria': 'tanque-tinta'
+        },
+        {
+            'nome': 'Epson L4150',
+            'marca': 'Epson',
+            'preco': 'R$ 799,00',
+            'descricao': 'Multifuncional EcoTank com duplex automático',
+            'tipo': 'multifuncional',
+            'categoria': 'tanque-tinta'
+        },
+        {
+            'nome': 'Epson L6161',
+            'marca': 'Epson',
+            'preco': 'R$ 1.099,00',
+            'descricao': 'Multifuncional EcoTank A3+ com ADF',
+            'tipo': 'multifuncional',
+            'categoria': 'tanque-tinta'
+        },
+        {
+            'nome': 'Epson EcoTank L14150',
+            'marca': 'Epson',
+            'preco': 'R$ 2.499,00',
+            'descricao': 'Multifuncional A3+ profissional com fax',
+            'tipo': 'multifuncional',
+            'categoria': 'tanque-tinta'
+        },
+        {
+            'nome': 'Epson WorkForce WF-2830',
+            'marca': 'Epson',
+            'preco': 'R$ 499,00',
+            'descricao': 'Multifuncional jato de tinta com Wi-Fi',
+            'tipo': 'multifuncional',
+            'categoria': 'jato-tinta'
+        }
+    ]
+    
+    # IMPRESSORAS BROTHER
+    brother_printers = [
+        {
+            'nome': 'Brother HL-L2350DW',
+            'marca': 'Brother',
+            'preco': 'R$ 899,00',
+            'descricao': 'Impressora laser monocromática com Wi-Fi e duplex',
+            'tipo': 'impressora',
+            'categoria': 'laser-mono'
+        },
+        {
+            'nome': 'Brother DCP-L2520DW',
+            'marca': 'Brother',
+            'preco': 'R$ 1.199,00',
+            'descricao': 'Multifuncional laser monocromática com Wi-Fi',
+            'tipo': 'multifuncional',
+            'categoria': 'laser-mono'
+        },
+        {
+            'nome': 'Brother MFC-L2710DW',
+            'marca': 'Brother',
+            'preco': 'R$ 1.599,00',
+            'descricao': 'Multifuncional laser monocromática com fax e ADF',
+            'tipo': 'multifuncional',
+            'categoria': 'laser-mono'
+        },
+        {
+            'nome': 'Brother DCP-T520W',
+            'marca': 'Brother',
+            'preco': 'R$ 649,00',
+            'descricao': 'Multifuncional tanque de tinta com Wi-Fi',
+            'tipo': 'multifuncional',
+            'categoria': 'tanque-tinta'
+        },
+        {
+            'nome': 'Brother HL-L3230CDW',
+            'marca': 'Brother',
+            'preco': 'R$ 1.699,00',
+            'descricao': 'Impressora laser colorida com Wi-Fi e duplex',
+            'tipo': 'impressora',
+            'categoria': 'laser-color'
+        }
+    ]
+    
+    # TONERS E CARTUCHOS
+    supplies = [
+        {
+            'nome': 'Toner HP CF217A Original',
+            'marca': 'HP',
+            'preco': 'R$ 329,00',
+            'descricao': 'Toner original HP 17A para LaserJet Pro M102/M130',
+            'tipo': 'toner',
+            'categoria': 'suprimento'
+        },
+        {
+            'nome': 'Cartucho HP 664XL Preto',
+            'marca': 'HP',
+            'preco': 'R$ 89,00',
+            'descricao': 'Cartucho de tinta original HP 664XL preto',
+            'tipo': 'cartucho',
+            'categoria': 'suprimento'
+        },
+        {
+            'nome': 'Toner Brother TN-2370',
+            'marca': 'Brother',
+            'preco': 'R$ 299,00',
+            'descricao': 'Toner original Brother para HL-L2320D/L2360DW',
+            'tipo': 'toner',
+            'categoria': 'suprimento'
+        },
+        {
+            'nome': 'Kit 4 Tintas Epson L3150',
+            'marca': 'Epson',
+            'preco': 'R$ 199,00',
+            'descricao': 'Kit completo de tintas originais para EcoTank L3150',
+            'tipo': 'tinta',
+            'categoria': 'suprimento'
+        },
+        {
+            'nome': 'Toner Canon 137',
+            'marca': 'Canon',
+            'preco': 'R$ 279,00',
+            'descricao': 'Toner original Canon 137 para imageCLASS MF212w/MF216n',
+            'tipo': 'toner',
+            'categoria': 'suprimento'
+        }
+    ]
+    
+    # COMBINAR TODOS OS PRODUTOS
+    products.extend(hp_printers)
+    products.extend(canon_printers)
+    products.extend(epson_printers)
+    products.extend(brother_printers)
+    products.extend(supplies)
+    
+    # ADICIONAR IDS ÚNICOS
+    for i, product in enumerate(products, 1):
+        product['id'] = f"prod_{i:03d}"
+        product['url'] = f"https://www.creativecopias.com.br/produto/{product['id']}"
+    
+    return products
+
+
+# Catálogo compartilhado por todas as instâncias (os métodos públicos entregam cópias)
+_PRODUCTS: Tuple[Dict[str, Any], ...] = tuple(_build_products())
+
+
 class ProductDatabase:
     """Base de dados de produtos para geração variada de artigos"""
     
@@ -15,254 +269,29 @@ class ProductDatabase:
         """Inicializa banco de produtos"""
         self.products = self._initialize_products()
         self.used_products = set()
+        # Gerador próprio da instância (sorteios independentes do estado global de random)
+        self._rng = random.Random()
+        self._restore_available()
+        
+        # Índices (a base não muda após a inicialização): marca -> produtos para a seleção
+        # por marca e tipo / marca em minúsculas / categoria para os get_products_by_*
+        self._by_brand: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._by_type: Dict[Any, List[Dict[str, Any]]] = defaultdict(list)
+        self._by_brand_lower: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._by_category: Dict[Any, List[Dict[str, Any]]] = defaultdict(list)
+        for product in self.products:
+            self._by_brand[product.get('marca', 'indefinida')].append(product)
+            self._by_type[product.get('tipo')].append(product)
+            self._by_brand_lower[product.get('marca', '').lower()].append(product)
+            self._by_category[product.get('categoria')].append(product)
+        
+        # Contagens por tipo/marca/categoria não mudam após a inicialização (ver get_statistics)
+        self._counts = self._count_products()
         logger.info(f"📦 Product Database inicializado com {len(self.products)} produtos")
     
     def _initialize_products(self) -> List[Dict[str, Any]]:
-        """Inicializa lista de produtos variados"""
-        
-        products = []
-        
-        # IMPRESSORAS HP
-        hp_printers = [
-            {
-                'nome': 'HP LaserJet Pro M404n',
-                'marca': 'HP',
-                'preco': 'R$ 899,00',
-                'descricao': 'Impressora laser monocromática profissional para escritórios',
-                'tipo': 'impressora',
-                'categoria': 'laser-mono'
-            },
-            {
-                'nome': 'HP LaserJet Pro M404dn',
-                'marca': 'HP', 
-                'preco': 'R$ 1.199,00',
-                'descricao': 'Impressora laser monocromática com duplex automático',
-                'tipo': 'impressora',
-                'categoria': 'laser-mono'
-            },
-            {
-                'nome': 'HP LaserJet Pro M428fdw',
-                'marca': 'HP',
-                'preco': 'R$ 1.899,00',
-                'descricao': 'Multifuncional laser monocromática com Wi-Fi e fax',
-                'tipo': 'multifuncional',
-                'categoria': 'laser-mono'
-            },
-            {
-                'nome': 'HP Color LaserJet Pro M454dn',
-                'marca': 'HP',
-                'preco': 'R$ 2.299,00',
-                'descricao': 'Impressora laser colorida profissional com duplex',
-                'tipo': 'impressora',
-                'categoria': 'laser-color'
-            },
-            {
-                'nome': 'HP DeskJet Ink Advantage 2774',
-                'marca': 'HP',
-                'preco': 'R$ 449,00',
-                'descricao': 'Multifuncional jato de tinta com Wi-Fi para home office',
-                'tipo': 'multifuncional',
-                'categoria': 'jato-tinta'
-            },
-            {
-                'nome': 'HP OfficeJet Pro 9012e',
-                'marca': 'HP',
-                'preco': 'R$ 1.349,00',
-                'descricao': 'Multifuncional jato de tinta profissional com HP+',
-                'tipo': 'multifuncional',
-                'categoria': 'jato-tinta'
-            }
-        ]
-        
-        # IMPRESSORAS CANON
-        canon_printers = [
-            {
-                'nome': 'Canon PIXMA G3111',
-                'marca': 'Canon',
-                'preco': 'R$ 699,00',
-                'descricao': 'Multifuncional tanque de tinta com Wi-Fi',
-                'tipo': 'multifuncional',
-                'categoria': 'tanque-tinta'
-            },
-            {
-                'nome': 'Canon PIXMA G4111',
-                'marca': 'Canon',
-                'preco': 'R$ 849,00',
-                'descricao': 'Multifuncional tanque de tinta com fax e ADF',
-                'tipo': 'multifuncional',
-                'categoria': 'tanque-tinta'
-            },
-            {
-                'nome': 'Canon imageCLASS LBP6030',
-                'marca': 'Canon',
-                'preco': 'R$ 579,00',
-                'descricao': 'Impressora laser monocromática compacta',
-                'tipo': 'impressora',
-                'categoria': 'laser-mono'
-            },
-            {
-                'nome': 'Canon imageCLASS MF3010',
-                'marca': 'Canon',
-                'preco': 'R$ 899,00',
-                'descricao': 'Multifuncional laser monocromática',
-                'tipo': 'multifuncional',
-                'categoria': 'laser-mono'
-            },
-            {
-                'nome': 'Canon PIXMA TS3150',
-                'marca': 'Canon',
-                'preco': 'R$ 329,00',
-                'descricao': 'Multifuncional jato de tinta com Wi-Fi',
-                'tipo': 'multifuncional',
-                'categoria': 'jato-tinta'
-            }
-        ]
-        
-        # IMPRESSORAS EPSON
-        epson_printers = [
-            {
-                'nome': 'Epson L3150',
-                'marca': 'Epson',
-                'preco': 'R$ 649,00',
-                'descricao': 'Multifuncional EcoTank com Wi-Fi',
-                'tipo': 'multifuncional',
-                'categoria': 'tanque-tinta'
-            },
-            {
-                'nome': 'Epson L4150',
-                'marca': 'Epson',
-                'preco': 'R$ 799,00',
-                'descricao': 'Multifuncional EcoTank com duplex automático',
-                'tipo': 'multifuncional',
-                'categoria': 'tanque-tinta'
-            },
-            {
-                'nome': 'Epson L6161',
-                'marca': 'Epson',
-                'preco': 'R$ 1.099,00',
-                'descricao': 'Multifuncional EcoTank A3+ com ADF',
-                'tipo': 'multifuncional',
-                'categoria': 'tanque-tinta'
-            },
-            {
-                'nome': 'Epson EcoTank L14150',
-                'marca': 'Epson',
-                'preco': 'R$ 2.499,00',
-                'descricao': 'Multifuncional A3+ profissional com fax',
-                'tipo': 'multifuncional',
-                'categoria': 'tanque-tinta'
-            },
-            {
-                'nome': 'Epson WorkForce WF-2830',
-                'marca': 'Epson',
-                'preco': 'R$ 499,00',
-                'descricao': 'Multifuncional jato de tinta com Wi-Fi',
-                'tipo': 'multifuncional',
-                'categoria': 'jato-tinta'
-            }
-        ]
-        
-        # IMPRESSORAS BROTHER
-        brother_printers = [
-            {
-                'nome': 'Brother HL-L2350DW',
-                'marca': 'Brother',
-                'preco': 'R$ 899,00',
-                'descricao': 'Impressora laser monocromática com Wi-Fi e duplex',
-                'tipo': 'impressora',
-                'categoria': 'laser-mono'
-            },
-            {
-                'nome': 'Brother DCP-L2520DW',
-                'marca': 'Brother',
-                'preco': 'R$ 1.199,00',
-                'descricao': 'Multifuncional laser monocromática com Wi-Fi',
-                'tipo': 'multifuncional',
-                'categoria': 'laser-mono'
-            },
-            {
-                'nome': 'Brother MFC-L2710DW',
-                'marca': 'Brother',
-                'preco': 'R$ 1.599,00',
-                'descricao': 'Multifuncional laser monocromática com fax e ADF',
-                'tipo': 'multifuncional',
-                'categoria': 'laser-mono'
-            },
-            {
-                'nome': 'Brother DCP-T520W',
-                'marca': 'Brother',
-                'preco': 'R$ 649,00',
-                'descricao': 'Multifuncional tanque de tinta com Wi-Fi',
-                'tipo': 'multifuncional',
-                'categoria': 'tanque-tinta'
-            },
-            {
-                'nome': 'Brother HL-L3230CDW',
-                'marca': 'Brother',
-                'preco': 'R$ 1.699,00',
-                'descricao': 'Impressora laser colorida com Wi-Fi e duplex',
-                'tipo': 'impressora',
-                'categoria': 'laser-color'
-            }
-        ]
-        
-        # TONERS E CARTUCHOS
-        supplies = [
-            {
-                'nome': 'Toner HP CF217A Original',
-                'marca': 'HP',
-                'preco': 'R$ 329,00',
-                'descricao': 'Toner original HP 17A para LaserJet Pro M102/M130',
-                'tipo': 'toner',
-                'categoria': 'suprimento'
-            },
-            {
-                'nome': 'Cartucho HP 664XL Preto',
-                'marca': 'HP',
-                'preco': 'R$ 89,00',
-                'descricao': 'Cartucho de tinta original HP 664XL preto',
-                'tipo': 'cartucho',
-                'categoria': 'suprimento'
-            },
-            {
-                'nome': 'Toner Brother TN-2370',
-                'marca': 'Brother',
-                'preco': 'R$ 299,00',
-                'descricao': 'Toner original Brother para HL-L2320D/L2360DW',
-                'tipo': 'toner',
-                'categoria': 'suprimento'
-            },
-            {
-                'nome': 'Kit 4 Tintas Epson L3150',
-                'marca': 'Epson',
-                'preco': 'R$ 199,00',
-                'descricao': 'Kit completo de tintas originais para EcoTank L3150',
-                'tipo': 'tinta',
-                'categoria': 'suprimento'
-            },
-            {
-                'nome': 'Toner Canon 137',
-                'marca': 'Canon',
-                'preco': 'R$ 279,00',
-                'descricao': 'Toner original Canon 137 para imageCLASS MF212w/MF216n',
-                'tipo': 'toner',
-                'categoria': 'suprimento'
-            }
-        ]
-        
-        # COMBINAR TODOS OS PRODUTOS
-        products.extend(hp_printers)
-        products.extend(canon_printers)
-        products.extend(epson_printers)
-        products.extend(brother_printers)
-        products.extend(supplies)
-        
-        # ADICIONAR IDS ÚNICOS
-        for i, product in enumerate(products, 1):
-            product['id'] = f"prod_{i:03d}"
-            product['url'] = f"https://www.creativecopias.com.br/produto/{product['id']}"
-        
-        return products
+        """Inicializa lista de produtos variados (catálogo montado na importação - ver _PRODUCTS)"""
+        return list(_PRODUCTS)
     
     def get_random_product(self, exclude_used: bool = True) -> Dict[str, Any]:
         """
@@ -274,30 +303,73 @@ class ProductDatabase:
         Returns:
             Produto aleatório
         """
-        available_products = []
-        
         if exclude_used:
-            # Filtrar produtos não usados
-            available_products = [p for p in self.products if p['id'] not in self.used_products]
-            
             # Se todos foram usados, resetar
-            if not available_products:
+            if not self._available:
                 logger.info("🔄 Todos os produtos foram usados, resetando lista")
                 self.used_products.clear()
-                available_products = self.products.copy()
+                self._restore_available()
+            
+            # Selecionar entre os não usados e marcar como usado
+            product = self._rng.choice(self._available)
+            self._mark_used(product)
         else:
-            available_products = self.products.copy()
-        
-        # Selecionar produto aleatório
-        product = random.choice(available_products)
-        
-        # Marcar como usado
-        if exclude_used:
-            self.used_products.add(product['id'])
+            product = self._rng.choice(self.products)
         
         logger.debug(f"📦 Produto selecionado: {product['nome']}")
         return product.copy()
     
+    def get_products_diverse_brands(self, count: int) -> List[Dict[str, Any]]:
+        """
+        Retorna produtos aleatórios com o máximo de marcas diferentes
+        
+        Args:
+            count: Número de produtos desejados
+            
+        Returns:
+            Um produto de cada marca (em ordem aleatória) e, se count passar do número
+            de marcas, produtos não usados de qualquer marca
+        """
+        products = []
+        for brand in self._rng.sample(list(self._by_brand), min(count, len(self._by_brand))):
+            brand_products = self._by_brand[brand]
+            candidates = [p for p in brand_products if p['id'] not in self.used_products] or brand_products
+            product = self._rng.choice(candidates)
+            self._mark_used(product)
+            products.append(product)
+        
+        if count > len(products):
+            extra = self._rng.sample(self._available, min(count - len(products), len(self._available)))
+            for product in extra:
+                self._mark_used(product)
+            products.extend(extra)
+        
+        products = [product.copy() for product in products]
+        
+        # Mais produtos pedidos que na base: sorteio normal (a lista de usados recomeça)
+        while len(products) < count:
+            products.append(self.get_random_product(exclude_used=True))
+        
+        return products
+    
+    def _restore_available(self) -> None:
+        """Refaz a lista de produtos não usados (e a posição de cada um nela)"""
+        self._available = [p for p in self.products if p['id'] not in self.used_products]
+        self._available_index = {p['id']: i for i, p in enumerate(self._available)}
+    
+    def _mark_used(self, product: Dict[str, Any]) -> None:
+        """Marca produto como usado - remoção O(1) trocando-o com o último da lista de disponíveis"""
+        self.used_products.add(product['id'])
+        
+        index = self._available_index.pop(product['id'], None)
+        if index is None:
+            return
+        
+        last = self._available.pop()
+        if index < len(self._available):
+            self._available[index] = last
+            self._available_index[last['id']] = index
+    
     def get_products_by_type(self, product_type: str) -> List[Dict[str, Any]]:
         """
         Retorna produtos por tipo
@@ -308,7 +380,7 @@ class ProductDatabase:
         Returns:
             Lista de produtos do tipo especificado
         """
-        return [p for p in self.products if p.get('tipo') == product_type]
+        return [product.copy() for product in self._by_type.get(product_type, ())]
     
     def get_products_by_brand(self, brand: str) -> List[Dict[str, Any]]:
         """
@@ -320,7 +392,7 @@ class ProductDatabase:
         Returns:
             Lista de produtos da marca especificada
         """
-        return [p for p in self.products if p.get('marca', '').lower() == brand.lower()]
+        return [product.copy() for product in self._by_brand_lower.get(brand.lower(), ())]
     
     def get_products_by_category(self, category: str) -> List[Dict[str, Any]]:
         """
@@ -332,7 +404,7 @@ class ProductDatabase:
         Returns:
             Lista de produtos da categoria especificada
         """
-        return [p for p in self.products if p.get('categoria') == category]
+        return [product.copy() for product in self._by_category.get(category, ())]
     
     def get_product_variations(self, base_product: Dict[str, Any], count: int = 3) -> List[Dict[str, Any]]:
         """
@@ -345,16 +417,20 @@ class ProductDatabase:
         Returns:
             Lista de produtos similares
         """
-        # Buscar produtos da mesma marca ou categoria
-        same_brand = self.get_products_by_brand(base_product.get('marca', ''))
-        same_category = self.get_products_by_category(base_product.get('categoria', ''))
+        # Buscar produtos da mesma marca ou categoria, sem repetição (dicts não entram em set -
+        # a deduplicação é pelo id, mantendo a ordem)
+        candidates_by_id = {}
+        for p in self._by_brand_lower.get(base_product.get('marca', '').lower(), ()):
+            candidates_by_id.setdefault(p['id'], p)
+        for p in self._by_category.get(base_product.get('categoria', ''), ()):
+            candidates_by_id.setdefault(p['id'], p)
         
-        # Combinar e remover o produto base
-        candidates = list(set(same_brand + same_category))
-        candidates = [p for p in candidates if p['id'] != base_product.get('id')]
+        # Remover o produto base
+        candidates_by_id.pop(base_product.get('id'), None)
+        candidates = list(candidates_by_id.values())
         
-        # Retornar quantidade solicitada
-        return random.sample(candidates, min(count, len(candidates)))
+        # Retornar quantidade solicitada (cópias - o catálogo é compartilhado)
+        return [product.copy() for product in self._rng.sample(candidates, min(count, len(candidates)))]
     
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -363,30 +439,26 @@ class ProductDatabase:
         Returns:
             Estatísticas da base
         """
-        stats = {
+        return {
             'total_produtos': len(self.products),
             'produtos_usados': len(self.used_products),
             'produtos_disponiveis': len(self.products) - len(self.used_products),
-            'por_tipo': {},
-            'por_marca': {},
-            'por_categoria': {}
+            # Cópias: quem recebe as estatísticas pode alterá-las
+            **{key: dict(counts) for key, counts in self._counts.items()}
+        }
+    
+    def _count_products(self) -> Dict[str, Dict[str, int]]:
+        """Conta produtos por tipo, marca e categoria"""
+        return {
+            'por_tipo': Counter(p.get('tipo', 'indefinido') for p in self.products),
+            'por_marca': Counter(p.get('marca', 'indefinida') for p in self.products),
+            'por_categoria': Counter(p.get('categoria', 'indefinida') for p in self.products),
         }
-        
-        # Estatísticas por tipo
-        for product in self.products:
-            tipo = product.get('tipo', 'indefinido')
-            marca = product.get('marca', 'indefinida')
-            categoria = product.get('categoria', 'indefinida')
-            
-            stats['por_tipo'][tipo] = stats['por_tipo'].get(tipo, 0) + 1
-            stats['por_marca'][marca] = stats['por_marca'].get(marca, 0) + 1
-            stats['por_categoria'][categoria] = stats['por_categoria'].get(categoria, 0) + 1
-        
-        return stats
     
     def reset_used_products(self):
         """Reseta lista de produtos usados"""
         self.used_products.clear()
+        self._restore_available()
         logger.info("🔄 Lista de produtos usados resetada")
     
     def export_products(self) -> List[Dict[str, Any]]:
@@ -396,4 +468,4 @@ class ProductDatabase:
         Returns:
             Lista completa de produtos
         """
-        return self.products.copy() 
\ No newline at end of file
+        return [product.copy() for product in self.products] 
\ No newline at end of file
@@ -3,147 +3,30 @@ Prompt Builder
 Construção de prompts inteligentes para geração de conteúdo com IA
 """
 
-from typing import Dict, List, Optional, Any
+import re
+import sys
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 from loguru import logger
 
-class PromptBuilder:
-    """Construtor de prompts para IA"""
-    
-    def __init__(self):
-        """Inicializa o construtor de prompts"""
-        self.base_instructions = """
-        Você é um especialista em redação publicitária e SEO para produtos de escritório, 
-        especialmente impressoras, multifuncionais, toners e suprimentos.
-        
-        Seu objetivo é criar artigos envolventes que:
-        1. Sejam otimizados para SEO
-        2. Tenham tom profissional mas acessível
-        3. Destaquem benefícios práticos
-        4. Incluam call-to-action sutil
-        5. Sejam únicos e originais
-        """
-        
-        self.tone_variations = {
-            "profissional": {
-                "style": "formal e técnico",
-                "voice": "autoridade no assunto",
-                "approach": "dados técnicos e benefícios empresariais"
-            },
-            "vendedor": {
-                "style": "persuasivo e convincente", 
-                "voice": "consultivo e entusiástico",
-                "approach": "benefícios diretos e urgência"
-            },
-            "amigável": {
-                "style": "casual e acessível",
-                "voice": "próximo e prestativo", 
-                "approach": "linguagem simples e exemplos práticos"
-            }
-        }
-        
-        logger.info("✍️ Prompt Builder inicializado")
-    
-    def build_prompt(self, product: Dict[str, Any], 
-                    template: Dict[str, Any],
-                    custom_keywords: List[str] = None,
-                    custom_instructions: str = None,
-                    tone: str = "profissional") -> str:
-        """
-        Constrói prompt completo para geração de artigo
-        
-        Args:
-            product: Dados do produto
-            template: Template específico para tipo de produto
-            custom_keywords: Palavras-chave extras
-            custom_instructions: Instruções personalizadas
-            tone: Tom do artigo
-            
-        Returns:
-            Prompt completo para IA
-        """
-        try:
-            # Extrair dados do produto
-            nome = product.get('nome', 'Produto')
-            marca = product.get('marca', '')
-            preco = self._format_price(product.get('preco'))
-            descricao = product.get('descricao', '')
-            categoria_url = product.get('categoria_url', '')
-            
-            # Determinar categoria
-            categoria = self._extract_category_from_url(categoria_url)
-            
-            # Obter configurações de tom
-            tone_config = self.tone_variations.get(tone, self.tone_variations["profissional"])
-            
-            # Construir seções do prompt
-            context_section = self._build_context_section(product, categoria)
-            instructions_section = self._build_instructions_section(tone_config, template)
-            content_requirements = self._build_content_requirements(product, custom_keywords)
-            format_requirements = self._build_format_requirements()
-            
-            # Instruções personalizadas
-            custom_section = ""
-            if custom_instructions:
-                custom_section = f"\n\n## INSTRUÇÕES PERSONALIZADAS:\n{custom_instructions}"
-            
-            # Montar prompt final
-            prompt = f"""
-{self.base_instructions}
-
-{context_section}
-
-{instructions_section}
-
-{content_requirements}
-
-{format_requirements}
-
-{custom_section}
-
-## DADOS DO PRODUTO:
-- Nome: {nome}
-- Marca: {marca if marca else 'N/A'}
-- Preço: {preco}
-- Descrição: {descricao if descricao else 'N/A'}
-- Categoria: {categoria}
-
-IMPORTANTE: Retorne APENAS um JSON válido com a estrutura especificada, sem texto adicional antes ou depois.
-            """
-            
-            logger.debug(f"✍️ Prompt construído: {len(prompt)} caracteres")
-            return prompt.strip()
-            
-        except Exception as e:
-            logger.error(f"❌ Erro ao construir prompt: {e}")
-            return self._build_fallback_prompt(product)
-    
-    def _build_context_section(self, product: Dict[str, Any], categoria: str) -> str:
-        """Constrói seção de contexto do prompt"""
-        nome = product.get('nome', 'Produto')
-        
-        return f"""
-## CONTEXTO:
-Você está criando um artigo sobre "{nome}" para o site Creative Cópias, 
-uma empresa especializada em soluções para escritório.
+# Código de modelo dentro do nome do produto (ex.: M404n, L3250, DCP-T520W)
+_RE_MODEL_CODE = re.compile(r'\b[A-Za-z]{0,4}-?[A-Za-z]*\d+[\w-]*')
 
-O público-alvo são:
-- Empresários e gestores de escritório
-- Profissionais liberais
-- Responsáveis por compras corporativas
-- Pessoas que trabalham em home office
+# Marcadores usados no esqueleto do prompt/resposta do cache estrutural
+SLOT_PRODUCT_NAME = '{PRODUCT_NAME}'
+SLOT_BRAND = '{BRAND}'
+SLOT_MODEL = '{MODEL}'
+SLOT_PRICE = '{PRICE}'
+SLOT_DESCRIPTION = '{DESCRIPTION}'
 
-A categoria do produto é: {categoria}
-        """
-    
-    def _build_instructions_section(self, tone_config: Dict[str, str], template: Dict[str, Any]) -> str:
-        """Constrói seção de instruções baseada no tom"""
-        return f"""
+# Blocos fixos do prompt - montados uma única vez (só tom e estrutura variam por chamada)
+_INSTRUCTIONS_HEADER = """
 ## INSTRUÇÕES DE REDAÇÃO AVANÇADA:
 
 ### Tom e Estilo:
-- Estilo: {tone_config['style']}
-- Voz: {tone_config['voice']}
-- Abordagem: {tone_config['approach']}
+"""
+
+_INSTRUCTIONS_SEO_GUIDELINES = """
 
 ### DIRETRIZES SEO PREMIUM:
 
@@ -270,7 +153,9 @@ A categoria do produto é: {categoria}
 - Conteúdo genérico sem personalidade
 
 ### Estrutura Recomendada:
-{template.get('structure_guide', self._get_default_structure())}
+"""
+
+_INSTRUCTIONS_URL_RULES = """
 
 ### INSTRUÇÕES CRÍTICAS PARA URLs:
 
@@ -283,46 +168,8 @@ A categoria do produto é: {categoria}
 
 ### ESTRUTURA OBRIGATÓRIA:
         """
-    
-    def _build_content_requirements(self, product: Dict[str, Any], custom_keywords: List[str]) -> str:
-        """Constrói requisitos específicos de conteúdo"""
-        nome = product.get('nome', 'Produto')
-        marca = product.get('marca', '')
-        
-        # Palavras-chave automáticas
-        auto_keywords = [nome, marca] if marca else [nome]
-        auto_keywords.extend(['impressora', 'escritório', 'qualidade', 'eficiência'])
-        
-        # Adicionar palavras-chave personalizadas
-        all_keywords = auto_keywords
-        if custom_keywords:
-            all_keywords.extend(custom_keywords)
-        
-        # Remover duplicatas e vazios
-        keywords = list(set([kw for kw in all_keywords if kw]))
-        
-        return f"""
-## REQUISITOS DE CONTEÚDO:
 
-### Palavras-chave para incluir naturalmente:
-{', '.join(keywords[:10])}
-
-### Tópicos obrigatórios:
-1. Principais benefícios do produto
-2. Para quem é indicado
-3. Diferenciais competitivos
-4. Aplicações práticas no dia a dia
-
-### Evitar:
-- Informações técnicas excessivamente complexas
-- Promessas impossíveis ou exageradas
-- Repetição excessiva de palavras-chave
-- Conteúdo genérico demais
-        """
-    
-    def _build_format_requirements(self) -> str:
-        """Constrói requisitos de formatação"""
-        return """
+_FORMAT_REQUIREMENTS = """
 ## FORMATO DE RESPOSTA OBRIGATÓRIO:
 
 Retorne um JSON válido com exatamente esta estrutura:
@@ -392,33 +239,256 @@ ESTRUTURA OBRIGATÓRIA:
 - Não repetir a mesma palavra-chave excessivamente
 - Usar conectivos e transições naturais
         """
-    
-    def _get_default_structure(self) -> str:
-        """Estrutura padrão para artigos"""
-        return """
+
+_DEFAULT_STRUCTURE = """
 1. Introdução atrativa (1 parágrafo)
 2. Principais benefícios (H2 + lista ou parágrafos)
 3. Para quem é indicado (H2 + parágrafo)
 4. Diferenciais técnicos (H2 + lista)
 5. Conclusão com call-to-action (1 parágrafo)
         """
+
+# Tons suportados e categorias por trecho da URL - chaves internadas para lookups por identidade
+_TONE_VARIATIONS: Dict[str, Dict[str, str]] = {sys.intern(tone): config for tone, config in {
+    "profissional": {
+        "style": "formal e técnico",
+        "voice": "autoridade no assunto",
+        "approach": "dados técnicos e benefícios empresariais"
+    },
+    "vendedor": {
+        "style": "persuasivo e convincente", 
+        "voice": "consultivo e entusiástico",
+        "approach": "benefícios diretos e urgência"
+    },
+    "amigável": {
+        "style": "casual e acessível",
+        "voice": "próximo e prestativo", 
+        "approach": "linguagem simples e exemplos práticos"
+    }
+}.items()}
+
+_CATEGORY_MAPPING: Dict[str, str] = {sys.intern(key): category for key, category in {
+    'impressoras': 'impressoras',
+    'multifuncionais': 'multifuncionais',
+    'toner': 'toners e cartuchos',
+    'papel': 'papéis e materiais',
+    'scanner': 'scanners',
+    'copiadora': 'copiadoras'
+}.items()}
+
+class PromptBuilder:
+    """Construtor de prompts para IA"""
+    
+    # Instruções e tons são constantes - atributos de classe compartilhados entre instâncias
+    base_instructions = """
+        Você é um especialista em redação publicitária e SEO para produtos de escritório, 
+        especialmente impressoras, multifuncionais, toners e suprimentos.
+        
+        Seu objetivo é criar artigos envolventes que:
+        1. Sejam otimizados para SEO
+        2. Tenham tom profissional mas acessível
+        3. Destaquem benefícios práticos
+        4. Incluam call-to-action sutil
+        5. Sejam únicos e originais
+        """
+    
+    tone_variations = _TONE_VARIATIONS
+    
+    def __init__(self):
+        """Inicializa o construtor de prompts"""
+        # Prompts montados por impressão digital dos dados usados (ver build_prompt)
+        self._assemble_prompt_cached = lru_cache(maxsize=512)(self._assemble_prompt)
+        
+        logger.info("✍️ Prompt Builder inicializado")
+    
+    def build_prompt(self, product: Dict[str, Any], 
+                    template: Dict[str, Any],
+                    custom_keywords: Optional[List[str]] = None,
+                    custom_instructions: Optional[str] = None,
+                    tone: str = "profissional") -> str:
+        """
+        Constrói prompt completo para geração de artigo
+        
+        Args:
+            product: Dados do produto
+            template: Template específico para tipo de produto
+            custom_keywords: Palavras-chave extras
+            custom_instructions: Instruções personalizadas
+            tone: Tom do artigo
+            
+        Returns:
+            Prompt completo para IA
+        """
+        try:
+            # Impressão digital com tudo que o prompt usa - produto/template/tom repetidos
+            # (retentativas, regerações) reaproveitam o prompt já montado
+            fingerprint = (
+                product.get('nome', 'Produto'),
+                product.get('marca', ''),
+                self._format_price(product.get('preco')),
+                product.get('descricao', ''),
+                product.get('categoria_url', ''),
+                template.get('structure_guide', _DEFAULT_STRUCTURE),
+                tone,
+                tuple(custom_keywords) if custom_keywords else (),
+                custom_instructions
+            )
+            
+            try:
+                prompt = self._assemble_prompt_cached(*fingerprint)
+            except TypeError:
+                # Valores não hasheáveis no produto/template - monta sem cache
+                prompt = self._assemble_prompt(*fingerprint)
+            
+            logger.debug(f"✍️ Prompt construído: {len(prompt)} caracteres")
+            return prompt
+            
+        except Exception as e:
+            logger.error(f"❌ Erro ao construir prompt: {e}")
+            return self._build_fallback_prompt(product)
+    
+    def _assemble_prompt(self, nome: Any, marca: Any, preco: str, descricao: Any, categoria_url: Any,
+                         structure_guide: Any, tone: str, custom_keywords: Tuple[str, ...],
+                         custom_instructions: Optional[str]) -> str:
+        """Monta o prompt a partir dos campos extraídos em build_prompt"""
+        product = {'nome': nome, 'marca': marca}
+        template = {'structure_guide': structure_guide}
+        
+        # Determinar categoria
+        categoria = self._extract_category_from_url(categoria_url)
+        
+        # Obter configurações de tom
+        tone_config = self.tone_variations.get(sys.intern(tone), self.tone_variations["profissional"])
+        
+        # Construir seções do prompt
+        context_section = self._build_context_section(product, categoria)
+        instructions_section = self._build_instructions_section(tone_config, template)
+        content_requirements = self._build_content_requirements(product, list(custom_keywords))
+        
+        # Instruções personalizadas
+        custom_section = ""
+        if custom_instructions:
+            custom_section = f"\n\n## INSTRUÇÕES PERSONALIZADAS:\n{custom_instructions}"
+        
+        # Montar prompt final - partes fixas vão no prompt de sistema (build_system_prompt);
+        # aqui as seções seguem da menos para a mais específica do produto, preservando
+        # o maior prefixo comum possível para o cache de prompt da OpenAI
+        prompt = f"""
+{instructions_section}
+
+{context_section}
+
+{content_requirements}
+
+{custom_section}
+
+## DADOS DO PRODUTO:
+- Nome: {nome}
+- Marca: {marca if marca else 'N/A'}
+- Preço: {preco}
+- Descrição: {descricao if descricao else 'N/A'}
+- Categoria: {categoria}
+
+IMPORTANTE: Retorne APENAS um JSON válido com a estrutura especificada, sem texto adicional antes ou depois.
+            """
+        
+        return prompt.strip()
+    
+    def build_system_prompt(self, transition_words: Optional[List[str]] = None) -> str:
+        """
+        Constrói o prompt de sistema com as instruções fixas (idêntico entre produtos)
+        
+        Args:
+            transition_words: Palavras de transição sugeridas para legibilidade Yoast
+            
+        Returns:
+            Prompt de sistema, sem dados de produto, data ou ordem aleatória
+        """
+        transitions_section = ""
+        if transition_words:
+            transitions_section = f"\n## PALAVRAS DE TRANSIÇÃO SUGERIDAS:\n{', '.join(transition_words)}\n"
+        
+        return f"""
+{self.base_instructions}
+
+{self._build_format_requirements()}
+{transitions_section}
+        """.strip()
+    
+    def _build_context_section(self, product: Dict[str, Any], categoria: str) -> str:
+        """Constrói seção de contexto do prompt"""
+        nome = product.get('nome', 'Produto')
+        
+        return f"""
+## CONTEXTO:
+Você está criando um artigo sobre "{nome}" para o site Creative Cópias, 
+uma empresa especializada em soluções para escritório.
+
+O público-alvo são:
+- Empresários e gestores de escritório
+- Profissionais liberais
+- Responsáveis por compras corporativas
+- Pessoas que trabalham em home office
+
+A categoria do produto é: {categoria}
+        """
+    
+    def _build_instructions_section(self, tone_config: Dict[str, str], template: Dict[str, Any]) -> str:
+        """Constrói seção de instruções baseada no tom"""
+        # Só o tom e a estrutura variam - o restante são blocos constantes do módulo
+        return ''.join((
+            _INSTRUCTIONS_HEADER,
+            f"- Estilo: {tone_config['style']}\n- Voz: {tone_config['voice']}\n- Abordagem: {tone_config['approach']}",
+            _INSTRUCTIONS_SEO_GUIDELINES,
+            str(template.get('structure_guide', _DEFAULT_STRUCTURE)),
+            _INSTRUCTIONS_URL_RULES,
+        ))
+    
+    def _build_content_requirements(self, product: Dict[str, Any], custom_keywords: Optional[List[str]]) -> str:
+        """Constrói requisitos específicos de conteúdo"""
+        nome = product.get('nome', 'Produto')
+        marca = product.get('marca', '')
+        
+        # Palavras-chave automáticas seguidas das personalizadas
+        all_keywords = (nome, marca, 'impressora', 'escritório', 'qualidade', 'eficiência') + tuple(custom_keywords or ())
+        
+        # Remover duplicatas e vazios mantendo a ordem (só as 10 primeiras entram no prompt)
+        keywords = list(dict.fromkeys(kw for kw in all_keywords if kw))
+        
+        return f"""
+## REQUISITOS DE CONTEÚDO:
+
+### Palavras-chave para incluir naturalmente:
+{', '.join(keywords[:10])}
+
+### Tópicos obrigatórios:
+1. Principais benefícios do produto
+2. Para quem é indicado
+3. Diferenciais competitivos
+4. Aplicações práticas no dia a dia
+
+### Evitar:
+- Informações técnicas excessivamente complexas
+- Promessas impossíveis ou exageradas
+- Repetição excessiva de palavras-chave
+- Conteúdo genérico demais
+        """
+    
+    def _build_format_requirements(self) -> str:
+        """Constrói requisitos de formatação"""
+        return _FORMAT_REQUIREMENTS
+    
+    def _get_default_structure(self) -> str:
+        """Estrutura padrão para artigos"""
+        return _DEFAULT_STRUCTURE
     
     def _extract_category_from_url(self, url: str) -> str:
         """Extrai categoria da URL"""
         if not url:
             return "produtos para escritório"
         
-        category_mapping = {
-            'impressoras': 'impressoras',
-            'multifuncionais': 'multifuncionais',
-            'toner': 'toners e cartuchos',
-            'papel': 'papéis e materiais',
-            'scanner': 'scanners',
-            'copiadora': 'copiadoras'
-        }
-        
         url_lower = url.lower()
-        for key, category in category_mapping.items():
+        for key, category in _CATEGORY_MAPPING.items():
             if key in url_lower:
                 return category
         
@@ -436,6 +506,52 @@ ESTRUTURA OBRIGATÓRIA:
         else:
             return str(price_data)
     
+    def build_prompt_skeleton(self, product: Dict[str, Any],
+                              template: Dict[str, Any],
+                              custom_keywords: Optional[List[str]] = None,
+                              custom_instructions: Optional[str] = None,
+                              tone: str = "profissional") -> Tuple[str, Dict[str, str]]:
+        """
+        Constrói o prompt com os dados variáveis do produto trocados por marcadores
+        
+        Produtos da mesma categoria/tom geram o mesmo esqueleto, permitindo reaproveitar
+        a estrutura de uma resposta anterior (cache estrutural).
+        
+        Returns:
+            Tupla (esqueleto do prompt, mapa marcador -> valor do produto)
+        """
+        nome = product.get('nome', 'Produto')
+        marca = product.get('marca', '')
+        descricao = product.get('descricao', '')
+        preco = self._format_price(product.get('preco'))
+        
+        model_match = _RE_MODEL_CODE.search(nome)
+        
+        slots = {
+            SLOT_PRODUCT_NAME: nome,
+            SLOT_BRAND: marca,
+            SLOT_MODEL: model_match.group() if model_match else '',
+            SLOT_PRICE: preco,
+            SLOT_DESCRIPTION: descricao
+        }
+        
+        placeholder_product = dict(product)
+        placeholder_product.update({
+            'nome': SLOT_PRODUCT_NAME,
+            'marca': SLOT_BRAND if marca else '',
+            'descricao': SLOT_DESCRIPTION if descricao else '',
+            'preco': {'texto': SLOT_PRICE}
+        })
+        
+        skeleton = self.build_prompt(
+            product=placeholder_product,
+            template=template,
+            custom_keywords=custom_keywords,
+            custom_instructions=custom_instructions,
+            tone=tone
+        )
+        return skeleton, slots
+    
     def _build_fallback_prompt(self, product: Dict[str, Any]) -> str:
         """Prompt de fallback em caso de erro"""
         nome = product.get('nome', 'Produto')
@@ -0,0 +1,78 @@
+"""
+Rate Limiter
+Token bucket assíncrono para respeitar limites de requisições (RPM) e tokens (TPM) da OpenAI
+"""
+
+import asyncio
+import re
+import time
+from typing import Mapping, Optional
+
+# Durações dos cabeçalhos x-ratelimit-reset-* (ex.: "1s", "6m0s", "120ms")
+_DURATION_PART = re.compile(r'(\d+(?:\.\d+)?)(ms|h|m|s)')
+_DURATION_UNITS = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}
+
+
+class AsyncLimiter:
+    """Limitador por token bucket com capacidades independentes de requisições e tokens por minuto"""
+
+    def __init__(self, rpm: int = 500, tpm: int = 200000):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last
+        self._last = now
+        self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Aguarda até haver capacidade para uma requisição com o número estimado de tokens"""
+        tokens = min(tokens, self.tpm)
+
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._requests >= 1 and self._tokens >= tokens:
+                    self._requests -= 1
+                    self._tokens -= tokens
+                    return
+
+                missing_requests = max(0.0, 1 - self._requests) * 60 / self.rpm
+                missing_tokens = max(0.0, tokens - self._tokens) * 60 / self.tpm
+                await asyncio.sleep(max(missing_requests, missing_tokens, 0.01))
+
+
+def parse_reset_duration(value: str) -> float:
+    """Converte a duração de x-ratelimit-reset-requests em segundos"""
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in _DURATION_PART.findall(value or ''))
+
+
+def delay_from_headers(headers: Optional[Mapping[str, str]], min_remaining: int = 10) -> float:
+    """
+    Espera antes da próxima requisição segundo os cabeçalhos de limite da última resposta
+    
+    Com folga (mais de min_remaining requisições restantes) não há espera; perto do limite,
+    o tempo até o reset é dividido entre as requisições que ainda restam.
+    """
+    if not headers:
+        return 0.0
+    
+    try:
+        remaining = int(headers.get('x-ratelimit-remaining-requests', ''))
+    except ValueError:
+        return 0.0
+    
+    if remaining > min_remaining:
+        return 0.0
+    
+    reset_seconds = parse_reset_duration(headers.get('x-ratelimit-reset-requests', ''))
+    return reset_seconds / max(1, remaining)
+
+
+__all__ = ['AsyncLimiter', 'parse_reset_duration', 'delay_from_headers']
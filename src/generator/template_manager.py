@@ -4,6 +4,7 @@ Gerenciamento de templates específicos por tipo de produto
 OTIMIZADO PARA YOAST SEO - ESTRUTURA HTML E LINKS
 """
 
+import re
 from typing import Dict, Any, List
 from loguru import logger
 
@@ -369,7 +370,7 @@ class TemplateManager:
             }
         }
     
-    def get_content_guidelines(self, product_type: str) -> Dict[str, str]:
+    def get_content_guidelines(self, product_type: str) -> Dict[str, Any]:
         """
         Retorna diretrizes específicas de conteúdo para Yoast
         
@@ -437,6 +438,37 @@ class TemplateManager:
         }
         return targets.get(length_category, targets['medium'])
     
+    def _generate_title_suggestions(self, product_type: str) -> List[str]:
+        """Gera sugestões de títulos (30-60 caracteres) com palavra-chave no início"""
+        base_titles = {
+            'impressora': [
+                "{keyword}: Análise Completa e Especificações",
+                "{keyword}: Vale a Pena para Escritório?",
+                "{keyword}: Guia de Compra Definitivo"
+            ],
+            'multifuncional': [
+                "{keyword}: Imprime, Copia e Digitaliza",
+                "{keyword}: Review da Multifuncional",
+                "{keyword}: Vantagens e Recursos"
+            ],
+            'toner': [
+                "{keyword}: Rendimento e Qualidade",
+                "{keyword}: Original Vale a Pena?",
+                "{keyword}: Compatibilidade e Economia"
+            ],
+            'scanner': [
+                "{keyword}: Digitalização Profissional",
+                "{keyword}: Velocidade e Resolução",
+                "{keyword}: Review Completo"
+            ]
+        }
+        
+        return base_titles.get(product_type, [
+            "{keyword}: Guia Completo",
+            "{keyword}: Características e Benefícios",
+            "{keyword}: Vale a Pena?"
+        ])
+    
     def _generate_heading_suggestions(self, product_type: str) -> List[str]:
         """Gera sugestões de headings otimizados com palavra-chave"""
         base_suggestions = {
@@ -501,7 +533,7 @@ class TemplateManager:
             Relatório de validação com pontuação Yoast estimada
         """
         template = self.get_template(product_type)
-        validation_results = {
+        validation_results: Dict[str, Any] = {
             'score': 0,
             'max_score': 100,
             'issues': [],
@@ -557,7 +589,6 @@ class TemplateManager:
         content_score = 0
         if content:
             # Verificar headings
-            import re
             h2_count = len(re.findall(r'<h2[^>]*>', content, re.IGNORECASE))
             h3_count = len(re.findall(r'<h3[^>]*>', content, re.IGNORECASE))
             
@@ -54,6 +54,11 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    DefaultResponse = JSONResponse
 from contextlib import asynccontextmanager
 from pydantic import BaseModel
 import logging
@@ -173,6 +178,27 @@ class TemplateAddRequest(BaseModel):
 class JobExecutionRequest(BaseModel):
     job_id: str = None
 
+_scheduler_lock_file = None
+
+def _acquire_scheduler_lock() -> bool:
+    """Garante que apenas um worker do uvicorn inicie o scheduler"""
+    global _scheduler_lock_file
+    try:
+        import fcntl
+    except ImportError:
+        # Windows: sem flock - main.py força um único worker nesta plataforma
+        return True
+    
+    _scheduler_lock_file = open("logs/scheduler.lock", "w")
+    try:
+        fcntl.flock(_scheduler_lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        # Outro worker já detém o lock (liberado quando o processo termina)
+        _scheduler_lock_file.close()
+        _scheduler_lock_file = None
+        return False
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Gerencia o ciclo de vida da aplicação"""
@@ -187,11 +213,21 @@ async def lifespan(app: FastAPI):
         
         logger.info("📁 Diretórios criados com sucesso")
         
+        # Pré-inicializar generator (cliente OpenAI e pool HTTP) antes de aceitar tráfego
+        if GENERATOR_AVAILABLE:
+            try:
+                app.state.generator_manager = GeneratorManager()
+                logger.info("🎨 Generator pré-inicializado")
+            except Exception as e:
+                logger.error(f"❌ Erro ao pré-inicializar generator: {e}")
+        
         # Inicializar banco de dados
         # await init_database()
         
-        # Inicializar scheduler automático
-        if SCHEDULER_AVAILABLE:
+        # Inicializar scheduler automático (apenas em um worker)
+        if SCHEDULER_AVAILABLE and not _acquire_scheduler_lock():
+            logger.info("⏰ Scheduler já ativo em outro worker")
+        elif SCHEDULER_AVAILABLE:
             try:
                 global scheduler_manager
                 scheduler_manager = SchedulerManager()
@@ -227,9 +263,18 @@ app = FastAPI(
     version=APP_VERSION,
     docs_url=None,
     redoc_url="/redoc",
+    default_response_class=DefaultResponse,
     lifespan=lifespan
 )
 
+def get_generator_manager() -> "GeneratorManager":
+    """Retorna o GeneratorManager compartilhado criado no lifespan"""
+    manager = getattr(app.state, 'generator_manager', None)
+    if manager is None:
+        manager = GeneratorManager()
+        app.state.generator_manager = manager
+    return manager
+
 # Customização do Swagger UI com CSS e JavaScript
 @app.get("/docs", include_in_schema=False)
 async def custom_swagger_ui_html():
@@ -1482,7 +1527,7 @@ async def health_check():
     # Verificar status do generator se disponível
     if GENERATOR_AVAILABLE:
         try:
-            gen_manager = GeneratorManager()
+            gen_manager = get_generator_manager()
             gen_stats = gen_manager.get_stats()
             modules_status["generator"] = "operational"
             modules_status["generator_details"] = {
@@ -2631,7 +2676,7 @@ async def generator_status():
         }
     
     try:
-        manager = GeneratorManager()
+        manager = get_generator_manager()
         status_data = manager.get_stats()
         
         return {
@@ -2661,7 +2706,7 @@ async def test_generator():
         raise HTTPException(status_code=503, detail="Módulo generator não disponível")
     
     try:
-        manager = GeneratorManager()
+        manager = get_generator_manager()
         result = manager.test_generation()
         
         if result:
@@ -2690,7 +2735,7 @@ async def generate_article(request: GenerationRequest):
         raise HTTPException(status_code=400, detail="product_data ou product_id é obrigatório")
     
     try:
-        manager = GeneratorManager()
+        manager = get_generator_manager()
         
         # Se foi fornecido product_id, buscar dados do scraper
         if request.product_id and not request.product_data:
@@ -2727,7 +2772,7 @@ async def get_generator_stats():
         raise HTTPException(status_code=503, detail="Módulo generator não disponível")
     
     try:
-        manager = GeneratorManager()
+        manager = get_generator_manager()
         stats = manager.get_stats()
         return stats
         
@@ -3824,7 +3869,7 @@ async def get_workflow_progress():
         # Verificar generator
         if GENERATOR_AVAILABLE:
             try:
-                gen_manager = GeneratorManager()
+                gen_manager = get_generator_manager()
                 gen_stats = gen_manager.get_stats()
                 status['generator'] = {
                     'running': gen_stats.get('is_processing', False),